@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tracemalloc
+from math import ceil
+from pathlib import Path
+from sudoku import InputError, solve_many
+
+# the values of a result that get worse when they go up, solves_per_sec gets worse when it goes down
+_LOWER_IS_BETTER: tuple[str] = ("p50_ms", "p99_ms", "peak_memory_kb")
+# latencies that change less than this many milliseconds are taken as timer noise
+_NOISE_MS: float = 1.0
+# modules a script solving sudokus with solve_many must not load, they are only needed to show games
+_LAZY_MODULES: tuple[str] = ("pandas", "colorama", "concurrent.futures", "multiprocessing")
+
+
+def load_corpus(corpus_path: str) -> dict:
+    """ function load_corpus reads the benchmark corpus saved in corpus_path, a json object with the corpus
+    version (version key) and the sudoku strings of every size (puzzles key) grouped by level (easy, hard
+    and pathological), an InputError is raised if the file doesn't have that format"""
+    with open(corpus_path, "r") as corpus_file:
+        corpus: dict = json.load(corpus_file)
+    if (not isinstance(corpus, dict) or not isinstance(corpus.get("version"), int)
+            or not isinstance(corpus.get("puzzles"), dict)
+            or not all(isinstance(levels, dict) for levels in corpus["puzzles"].values())):
+        raise InputError(f"Invalid benchmark corpus in {corpus_path}, expected a version and the puzzles "
+                         f"of each size grouped by level.")
+    return corpus
+
+
+def _percentile(values: list[float], share: float) -> float:
+    """ function _percentile returns the value below which share (0 to 1) of the sorted values fall, using
+    the nearest rank so the result is always one of the values"""
+    return values[max(0, ceil(share * len(values)) - 1)]
+
+
+def _time_games(games: list[str], engine: str | None, max_time: int | float) -> tuple[list[float], int]:
+    """ function _time_games solves games with solve_many and returns the seconds each solved game took
+    (wall clock time) and how many games raised an error"""
+    latencies: list[float] = []
+    errors: int = 0
+    records = solve_many(games, max_time=max_time, engine=engine)
+    while True:
+        start: float = time.perf_counter()
+        record: dict | None = next(records, None)
+        end: float = time.perf_counter()
+        if record is None:
+            return latencies, errors
+        if record["error"] is None:
+            latencies.append(end - start)
+        else:
+            errors += 1
+
+
+def import_time(repeat: int = 5) -> tuple[float, list[str]]:
+    """ function import_time returns the fastest time in milliseconds a new python process takes to import
+    the sudoku module out of repeat tries, along with the modules of _LAZY_MODULES loaded after solving a
+    sudoku with solve_many, which should be none"""
+    code: str = ("import sys, time\nstart = time.perf_counter()\nimport sudoku\nend = time.perf_counter()\n"
+                 "next(sudoku.solve_many(['12233441|||']))\n"
+                 f"print((end - start) * 1000, *(name for name in {_LAZY_MODULES} if name in sys.modules))")
+    times: list[float] = []
+    loaded: list[str] = []
+    for _ in range(repeat):
+        output: list[str] = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                           cwd=os.path.abspath(os.path.dirname(__file__))).stdout.split()
+        times.append(float(output[0]))
+        loaded = output[1:]
+    return round(min(times), 3), loaded
+
+
+def run_benchmark(corpus: dict, sizes: list[int] | None = None, repeat: int = 3, engine: str | None = None,
+                  max_time: int | float = 1) -> dict:
+    """ function run_benchmark solves every game of the corpus sizes (all of them if sizes is None) repeat
+    times and returns for each size the games solved per second, the 50th and 99th percentile of the time
+    a game takes in milliseconds, the peak memory traced while solving all of them once in kilobytes and
+    the games that couldn't be solved, along with the corpus version, the engine used (the one solve_many
+    picks for each size if engine is None) and the time it takes to import the sudoku module in milliseconds,
+    max_time is the time limit of each game in minutes"""
+    if not isinstance(repeat, int) or repeat < 1:
+        raise InputError(f"Expected an int greater than 0 got {repeat} instead.")
+    results: dict = {"version": corpus["version"], "engine": engine or "default", "sizes": {}}
+    results["import_ms"], results["import_loads"] = import_time()
+    for size, levels in corpus["puzzles"].items():
+        if sizes is not None and int(size) not in sizes:
+            continue
+        games: list[str] = [game for level in levels.values() for game in level]
+        # the memory run also builds the tables of the size so the timed runs don't pay for them
+        tracemalloc.start()
+        try:
+            _, errors = _time_games(games, engine, max_time)
+            peak: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        latencies: list[float] = []
+        for _ in range(repeat):
+            latencies.extend(_time_games(games, engine, max_time)[0])
+        latencies.sort()
+        results["sizes"][size] = {
+            "games": len(games),
+            "errors": errors,
+            "solves_per_sec": round(len(latencies) / sum(latencies), 2) if latencies else 0.0,
+            "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3) if latencies else 0.0,
+            "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3) if latencies else 0.0,
+            "peak_memory_kb": round(peak / 1024, 1)
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> list[str]:
+    """ function compare returns a message for every value of results that is worse than the same value of
+    baseline by more than tolerance (0.25 is 25%) and for every size that fails to solve more games than
+    before, latencies less than a millisecond apart are not reported, only the sizes in both are compared and an
+    InputError is raised if their corpus versions differ, the import time of the sudoku module is compared too
+    and importing it must never load the modules only needed to show games"""
+    if results.get("version") != baseline.get("version"):
+        raise InputError(f"Can't compare results of corpus version {results.get('version')} with a baseline "
+                         f"of corpus version {baseline.get('version')}.")
+    regressions: list[str] = []
+    if results.get("import_loads"):
+        regressions.append(f"importing sudoku loads {', '.join(results['import_loads'])}")
+    if ("import_ms" in results and "import_ms" in baseline
+            and results["import_ms"] > baseline["import_ms"] * (1 + tolerance)
+            and results["import_ms"] - baseline["import_ms"] > _NOISE_MS):
+        regressions.append(f"import_ms {results['import_ms']}, baseline {baseline['import_ms']}")
+    for size, current in results["sizes"].items():
+        before: dict | None = baseline["sizes"].get(size)
+        if before is None:
+            continue
+        if current["errors"] > before["errors"]:
+            regressions.append(f"size {size}: {current['errors']} games failed, baseline {before['errors']}")
+        if current["solves_per_sec"] < before["solves_per_sec"] * (1 - tolerance):
+            regressions.append(f"size {size}: solves_per_sec {current['solves_per_sec']}, "
+                               f"baseline {before['solves_per_sec']}")
+        for key in _LOWER_IS_BETTER:
+            if current[key] > before[key] * (1 + tolerance) and (not key.endswith("_ms")
+                                                                 or current[key] - before[key] > _NOISE_MS):
+                regressions.append(f"size {size}: {key} {current[key]}, baseline {before[key]}")
+    return regressions
+
+
+def _report(results: dict) -> str:
+    """ function _report returns the results of a benchmark as a table with a row for each size"""
+    lines: list[str] = [f"corpus version {results['version']}, engine {results['engine']}, "
+                        f"import {results['import_ms']} ms",
+                        f"{'size':>5}{'games':>7}{'errors':>8}{'solves/s':>11}{'p50 ms':>10}{'p99 ms':>10}"
+                        f"{'peak kb':>10}"]
+    for size, values in results["sizes"].items():
+        lines.append(f"{size:>5}{values['games']:>7}{values['errors']:>8}{values['solves_per_sec']:>11}"
+                     f"{values['p50_ms']:>10}{values['p99_ms']:>10}{values['peak_memory_kb']:>10}")
+    return "\n".join(lines)
+
+
+def main(args: list[str] | None = None,
+         corpus_file=str(Path(os.path.abspath(os.path.dirname(__file__))) / "benchmark_corpus.json")) -> None:
+    """ function main reads the benchmark options from the command line, runs the benchmark and prints its
+    results, it can save them as a baseline and exits with an error if they are worse than a baseline"""
+    parser = argparse.ArgumentParser(description="benchmark the sudoku solver over a graded corpus of sudokus")
+    parser.add_argument("--corpus", default=corpus_file, help="json file with the sudokus to solve")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None, help="sizes to benchmark (all by default)")
+    parser.add_argument("--repeat", type=int, default=3, help="times every sudoku is solved")
+    parser.add_argument("--engine", choices=("propagation", "dlx"), default=None,
+                        help="solving engine (by default the one solve_many picks for each size)")
+    parser.add_argument("--max-time", type=float, default=1, help="time limit of each sudoku in minutes")
+    parser.add_argument("--save", default=None, help="json file where the results are saved as a baseline")
+    parser.add_argument("--baseline", default=None, help="json file with the results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="share a value can get worse (0.25 is 25%%)")
+    options = parser.parse_args(args)
+    try:
+        results: dict = run_benchmark(load_corpus(options.corpus), options.sizes, options.repeat, options.engine,
+                                      options.max_time)
+        print(_report(results))
+        if options.save is not None:
+            with open(options.save, "w") as baseline_file:
+                json.dump(results, baseline_file, indent=4)
+        if options.baseline is not None:
+            with open(options.baseline, "r") as baseline_file:
+                regressions: list[str] = compare(results, json.load(baseline_file), options.tolerance)
+            if regressions:
+                sys.exit("regressions against the baseline:\n" + "\n".join(regressions))
+            print("no regressions against the baseline")
+    except (InputError, OSError, json.JSONDecodeError) as error:
+        sys.exit(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import numpy as np
+from typing import Iterable
+from sudoku import InputError, Sudoku, LAYOUTS, _SYMBOLS, _min_givens
+
+# value of every byte of a sudoku string: 1 on for the symbols, 0 for empty cells and _INVALID for the rest
+_INVALID: int = 255
+_VALUES: np.ndarray = np.full(256, _INVALID, dtype=np.uint8)
+_VALUES[np.frombuffer(_SYMBOLS.encode(), dtype=np.uint8)] = np.arange(1, len(_SYMBOLS) + 1)
+_VALUES[ord("-")] = 0
+# symbol of every value, - for empty cells
+_SYMBOL_BYTES: np.ndarray = np.frombuffer(("-" + _SYMBOLS).encode(), dtype=np.uint8)
+_UNIT_NAMES: tuple[str] = ("row", "column", "quadrant")
+
+
+def _game_size(game: str) -> int:
+    """ function _game_size returns the size a sudoku string seems to have from its length or its rows"""
+    return game.count("|") + 1 if "|" in game else int(len(game) ** 0.5)
+
+
+def _invalid(game: str) -> InputError:
+    """ function _invalid returns the error of a sudoku string that doesn't have a valid format"""
+    return InputError("Invalid value for class Sudoku size argument, "
+                      f"\nexpected a valid sudoku string your value: {game}.", game=game)
+
+
+def _decode_dense(games: list[str], indexes: list[int], size: int, grids: np.ndarray,
+                  errors: list[InputError | None]) -> None:
+    """ function _decode_dense writes into grids the values of the games in indexes written with one symbol
+    per cell, all of them are turned into values at once by looking up their bytes"""
+    for index in indexes:
+        if len(games[index]) != size ** 2:
+            errors[index] = _invalid(games[index])
+    indexes = [index for index in indexes if errors[index] is None]
+    if not indexes:
+        return
+    raw: np.ndarray = np.frombuffer("".join(games[index] for index in indexes).encode("ascii", "replace"),
+                                    dtype=np.uint8)
+    values: np.ndarray = _VALUES[raw].reshape(len(indexes), size ** 2)
+    bad: np.ndarray = (values > size).any(axis=1)
+    for position in np.flatnonzero(bad):
+        errors[indexes[position]] = _invalid(games[indexes[position]])
+    values[bad] = 0
+    grids[indexes] = values.reshape(len(indexes), size, size)
+
+
+def _decode_sparse(games: list[str], indexes: list[int], size: int, grids: np.ndarray,
+                   errors: list[InputError | None]) -> None:
+    """ function _decode_sparse writes into grids the values of the games in indexes written as rows split
+    by | with a (column, value) pair of symbols for every initial value. The games are joined into one
+    buffer where the row of every byte comes from counting the | before it, so the pairs of every game
+    are placed at once"""
+    for index in indexes:
+        if games[index].count("|") != size - 1:
+            errors[index] = _invalid(games[index])
+    indexes = [index for index in indexes if errors[index] is None]
+    if not indexes:
+        return
+    raw: np.ndarray = np.frombuffer("|".join(games[index] for index in indexes).encode("ascii", "replace"),
+                                    dtype=np.uint8)
+    bar: np.ndarray = raw == ord("|")
+    bars: np.ndarray = np.flatnonzero(bar)
+    starts: np.ndarray = np.concatenate(([0], bars + 1))
+    lengths: np.ndarray = np.concatenate((bars, [len(raw)])) - starts
+    # rows of odd length or with more pairs than columns break the game they belong to
+    bad: np.ndarray = np.zeros(len(indexes), dtype=bool)
+    bad[np.flatnonzero((lengths % 2 == 1) | (lengths > 2 * size)) // size] = True
+    positions: np.ndarray = np.flatnonzero(~bar)
+    rows: np.ndarray = np.cumsum(bar)[positions]
+    positions, rows = positions[~bad[rows // size]], rows[~bad[rows // size]]
+    cols: np.ndarray = _VALUES[raw[positions[0::2]]].astype(np.int64)
+    values: np.ndarray = _VALUES[raw[positions[1::2]]]
+    rows = rows[0::2]
+    wrong: np.ndarray = (cols < 1) | (cols > size) | (values < 1) | (values > size)
+    bad[rows[wrong] // size] = True
+    # a cell given more than once is not a valid game either
+    cells: np.ndarray = rows * size + cols - 1
+    counts: np.ndarray = np.bincount(cells[~wrong], minlength=len(indexes) * size ** 2)
+    bad[np.flatnonzero(counts > 1) // size ** 2] = True
+    keep: np.ndarray = ~bad[rows // size] & ~wrong
+    flat: np.ndarray = np.zeros((len(indexes), size ** 2), dtype=np.uint8)
+    flat.reshape(-1)[cells[keep]] = values[keep]
+    for position in np.flatnonzero(bad):
+        errors[indexes[position]] = _invalid(games[indexes[position]])
+    grids[indexes] = flat.reshape(len(indexes), size, size)
+
+
+def _units(size: int) -> np.ndarray:
+    """ function _units returns for every cell the numbers of its row, column and quadrant units"""
+    return np.array([tuple(number for number, _ in places) for places in LAYOUTS[size].cell_places], dtype=np.int64)
+
+
+def _repeated(game: str, size: int, flat: np.ndarray, units: np.ndarray, keys: np.ndarray,
+              counts: np.ndarray) -> InputError:
+    """ function _repeated returns the error of a game with equal values in a row, column or quadrant, with a
+    message for every repeated value of a unit and the cells involved (values of the error)"""
+    base: int = LAYOUTS[size].base
+    messages: list[str] = []
+    cells: set[int] = set()
+    for cell in np.flatnonzero(flat):
+        for kind, unit in enumerate(units[cell]):
+            if counts[keys[cell, kind]] > 1:
+                cells.add(int(cell))
+                value: int = int(flat[cell])
+                number: int = int(unit) - kind * size
+                if kind == 2:
+                    message: str = (f"input error between row{number // base * base + 1} -> "
+                                    f"row{number // base * base + base} and col{number % base * base + 1} -> "
+                                    f"col{number % base * base + base}: \ncan't have equal values ({value}) "
+                                    "in the same quadrant.")
+                else:
+                    message: str = (f"input error at {('row', 'col')[kind]}{number + 1}: \ncan't have two or more "
+                                    f"equal values ({value}) in the same {_UNIT_NAMES[kind]}.")
+                if message not in messages:
+                    messages.append(message)
+    return InputError(*messages, game=game, values=[{"row": cell // size + 1, "col": cell % size + 1,
+                                                     "invalid_value": int(flat[cell])} for cell in sorted(cells)])
+
+
+def decode_games(games: Iterable[str], size: int | None = None) -> tuple[np.ndarray, list[InputError | None]]:
+    """ function decode_games turns many sudoku strings of the same size at once (in any of the formats the
+    Sudoku size property takes) into a (games, size, size) array of uint8 values, 0 for empty cells, and
+    a list with the InputError of every game or None if the game is valid, the rows of invalid games are
+    left empty. The size is the one of the first game if none is given, games are checked for their
+    format, the minimum amount of initial values and equal values in a row, column or quadrant, the
+    last check counts every unit and value of every game together so no game is checked on its own"""
+    games = list(games)
+    if size is None:
+        size = _game_size(games[0]) if games else 9
+    if not Sudoku.valid_size(size):
+        raise InputError(f"Invalid value for size, expected a square number like 4, 9, 16 or 25 your value: {size}.")
+    grids: np.ndarray = np.zeros((len(games), size, size), dtype=np.uint8)
+    errors: list[InputError | None] = [None] * len(games)
+    _decode_dense(games, [index for index, game in enumerate(games) if "|" not in game], size, grids, errors)
+    _decode_sparse(games, [index for index, game in enumerate(games) if "|" in game], size, grids, errors)
+    flat: np.ndarray = grids.reshape(len(games), size ** 2)
+    givens: np.ndarray = np.count_nonzero(flat, axis=1)
+    for index in np.flatnonzero(givens < _min_givens(size)):
+        if errors[index] is None:
+            errors[index] = InputError("The minimum amount of number to solve a sudoku of\n"
+                                       f"size {size} is {_min_givens(size)} and your sudoku has {givens[index]}.",
+                                       game=games[index])
+    # every initial value counts once for its row, column and quadrant, a count over 1 is a repetition
+    units: np.ndarray = _units(size)
+    game_numbers, cells = np.nonzero(flat)
+    keys: np.ndarray = ((game_numbers[:, None] * 3 * size + units[cells]) * size
+                        + flat[game_numbers, cells][:, None].astype(np.int64) - 1)
+    counts: np.ndarray = np.bincount(keys.ravel(), minlength=len(games) * 3 * size ** 2)
+    for index in np.unique(game_numbers[(counts[keys] > 1).any(axis=1)]):
+        if errors[index] is None:
+            game_keys: np.ndarray = ((index * 3 * size + units) * size + flat[index][:, None].astype(np.int64) - 1)
+            errors[index] = _repeated(games[index], size, flat[index], units, game_keys, counts)
+    grids[[index for index, error in enumerate(errors) if error is not None]] = 0
+    return grids, errors
+
+
+def encode_games(grids: np.ndarray) -> list[str]:
+    """ function encode_games turns a (games, size, size) array of values (0 for empty cells) into sudoku
+    strings with the same format the stringify method of a Solution object uses for the start of a game,
+    rows split by | with (column, value) pairs when that is shorter and one symbol per cell otherwise"""
+    total, size = len(grids), grids.shape[-1]
+    flat: np.ndarray = np.ascontiguousarray(grids.reshape(total, size ** 2))
+    dense: list[bytes] = _SYMBOL_BYTES[flat].view(f"S{size ** 2}").ravel().tolist()
+    givens: np.ndarray = np.count_nonzero(flat, axis=1)
+    symbols: str = _SYMBOLS[:size]
+    strings: list[str] = []
+    for index in range(total):
+        if givens[index] * 2 + size - 1 < size ** 2:
+            rows: np.ndarray = grids[index]
+            strings.append("|".join("".join(symbols[col] + symbols[row[col] - 1] for col in np.flatnonzero(row))
+                                    for row in rows))
+        else:
+            strings.append(dense[index].decode())
+    return strings
@@ -0,0 +1,184 @@
+import os
+import sys
+import random
+import argparse
+from pathlib import Path
+from typing import Iterator
+from sudoku import Candidates, DancingLinks, LAYOUTS, Sudoku, SudokuError, InputError, solve_many
+from data import Database, DatabaseError
+
+# sizes the digger can make unique games of in seconds, from 25 by 25 on proving that a value can go takes
+# minutes for every game so larger sudokus can be solved and played but not generated
+SIZES: tuple[int] = (4, 9, 16)
+
+
+def _full_grid(size: int, rng: random.Random) -> list[int]:
+    """ function _full_grid returns the values of a random solved sudoku of the given size, the quadrants of
+    the main diagonal don't share any row or column so they are filled with random values and the rest of
+    the grid is completed by the dancing links engine"""
+    layout = LAYOUTS[size]
+    while True:
+        game = Candidates(size)
+        for quadrant in range(0, size, layout.base + 1):
+            for cell, value in zip(layout.quadrants[quadrant], rng.sample(range(1, size + 1), size)):
+                game.place(cell, value)
+        # only in 4 by 4 sudokus the diagonal quadrants can leave the rest of the grid without a solution
+        if not game.dead and (found := next(DancingLinks(game).search(), None)) is not None:
+            for cell, value in found:
+                game.place(cell, value)
+            return game.values
+
+
+def _settle(game: Candidates) -> bool:
+    """ function _settle plays every naked and hidden single left in game, it returns False if the game
+    turns out to have no solution"""
+    while True:
+        cell: int | None = game.next_single()
+        if cell is not None:
+            value: int = game.masks[cell].bit_length()
+        elif (hidden := game.next_hidden()) is not None:
+            cell, value = hidden
+        else:
+            return not game.dead
+        if not game.place(cell, value):
+            return False
+
+
+def _has_solution(game: Candidates, budget: list[int]) -> bool:
+    """ function _has_solution searches depth first a solution for game trying the cell with the fewest
+    possibilities first, every guess spends one unit of budget and once it runs out the game is taken as
+    solvable, game is left solved if a solution is found"""
+    cell: int = min((cell for cell, mask in enumerate(game.masks) if mask),
+                    key=lambda option: game.masks[option].bit_count())
+    for value in game.options(game.masks[cell]):
+        budget[0] -= 1
+        if budget[0] < 0:
+            return True
+        mark: int = game.checkpoint()
+        if game.place(cell, value) and _settle(game) and (not game.unsolved or _has_solution(game, budget)):
+            return True
+        game.rollback(mark)
+    return False
+
+
+def _dig(size: int, rng: random.Random, givens: int, budget: int) -> tuple[list[int], list[int]]:
+    """ function _dig removes in random order the values of a random solved grid while the game keeps a
+    unique solution or until only givens values are left, it returns the solved grid and the cells kept.
+    A value can go if no solution has another value in its cell, to check it the cells are played once in
+    reverse order with a checkpoint before each one, rolling back to the checkpoint of a cell leaves every
+    cell after it played, so only the cells kept before it have to be played again"""
+    grid: list[int] = _full_grid(size, rng)
+    order: list[int] = list(range(size ** 2))
+    rng.shuffle(order)
+    game = Candidates(size)
+    marks: list[int] = [0] * size ** 2
+    for index in range(size ** 2 - 1, -1, -1):
+        marks[index] = game.checkpoint()
+        game.place(order[index], grid[order[index]])
+    kept: list[int] = []
+    for index, cell in enumerate(order):
+        if len(kept) + size ** 2 - index <= givens:
+            kept.extend(order[index:])
+            break
+        game.rollback(marks[index])
+        for other in kept:
+            game.place(other, grid[other])
+        # a cell whose proof runs out of budget is kept, that never breaks the uniqueness of the game
+        if game.remove(cell, grid[cell]) and _settle(game) and (not game.unsolved
+                                                                 or _has_solution(game, [budget])):
+            kept.append(cell)
+    return grid, kept
+
+
+def _game_string(size: int, grid: list[int], cells: list[int]) -> str:
+    """ function _game_string returns the sudoku string of the values of grid in cells with the same format
+    the stringify method of a Solution object uses for the start of the game"""
+    if len(cells) * 2 + size - 1 < size ** 2:
+        rows: list[list[int]] = [[] for _ in range(size)]
+        for cell in sorted(cells):
+            rows[cell // size].append(cell)
+        return "|".join("".join(f"{Sudoku.tr(cell % size + 1)}{Sudoku.tr(grid[cell])}" for cell in row)
+                        for row in rows)
+    shown: set[int] = set(cells)
+    return "".join(str(Sudoku.tr(grid[cell])) if cell in shown else "-" for cell in range(size ** 2))
+
+
+def generate(size: int = 9, total: int = 1, givens: int = 0, difficulty: tuple[int, int] | None = None,
+             seed: int | None = None, budget: int = 2_000, attempts: int = 1_000) -> Iterator[dict]:
+    """ function generate is a generator that yields total new sudokus of the given size with only one
+    solution each, every sudoku is a solve_many record (start, end, start_vals, solving_time, difficulty
+    and error keys) with the raw difficulty the database stores. Values are removed until the game would
+    get a second solution or only givens values are left, games with more values left than givens or a
+    difficulty outside the difficulty range (low, high) are discarded, budget bounds the guesses spent to
+    prove that a value can go and after attempts games in a row are discarded a SudokuError is raised, only
+    the sizes in SIZES can be generated"""
+    if size not in SIZES:
+        raise InputError(f"Invalid value for size, expected one of {', '.join(map(str, SIZES))} your value: {size}.")
+    rng = random.Random(seed)
+    missed: list[int] = [0]
+
+    def games() -> Iterator[str]:
+        while True:
+            grid, kept = _dig(size, rng, givens, budget)
+            if not givens or len(kept) <= givens:
+                yield _game_string(size, grid, kept)
+            else:
+                missed[0] += 1
+            if missed[0] >= attempts:
+                raise SudokuError(f"couldn't generate a sudoku of size {size} with {givens} values or less "
+                                  f"in {attempts} attempts.")
+
+    made: int = 0
+    if total < 1:
+        return
+    for record in solve_many(games(), raw_level=True):
+        if record["error"] is None and (difficulty is None or difficulty[0] <= record["difficulty"] <= difficulty[1]):
+            missed[0] = 0
+            made += 1
+            yield record
+            if made == total:
+                return
+        else:
+            missed[0] += 1
+
+
+def save_games(records: Iterator[dict], db_path: str) -> int:
+    """ function save_games inserts all at once the generated sudokus of records into the sudokus table of the
+    database in db_path, skipping the ones whose solution is already saved, and returns how many were added,
+    the sudokus table is created if the database doesn't have it yet"""
+    new_query: str = ("INSERT INTO sudokus (start_str, end_str, init_vals, difficulty, size) "
+                      "SELECT ?, ?, ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM sudokus WHERE end_str = ?)")
+    with Database(db_path=db_path) as add_entries:
+        add_entries.write_db("CREATE TABLE IF NOT EXISTS sudokus (id INTEGER PRIMARY KEY, start_str TEXT, "
+                             "end_str TEXT, init_vals INTEGER, difficulty INTEGER, size INTEGER)")
+        before: int = next(add_entries.read_db(entries="SELECT count(*) FROM sudokus"))[0]
+        add_entries.write_db(values=(new_query, [(record["start"], record["end"], record["start_vals"],
+                                                  record["difficulty"], int(len(record["end"]) ** 0.5), record["end"])
+                                                 for record in records]),
+                             many=True)
+        return next(add_entries.read_db(entries="SELECT count(*) FROM sudokus"))[0] - before
+
+
+def main(args: list[str] | None = None,
+         db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku_table.db"))) -> None:
+    """ function main reads the generator options from the command line, generates the sudokus and saves
+    them into the database"""
+    parser = argparse.ArgumentParser(description="generate sudokus with a unique solution and save them")
+    parser.add_argument("size", type=int, choices=SIZES, help="size of the sudokus")
+    parser.add_argument("total", type=int, help="number of sudokus to generate")
+    parser.add_argument("--givens", type=int, default=0, help="most initial values a sudoku can have")
+    parser.add_argument("--difficulty", type=int, nargs=2, default=None, metavar=("LOW", "HIGH"),
+                        help="range of the raw difficulty of the sudokus")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random generator")
+    parser.add_argument("--db", default=db_file, help="database file where the sudokus are saved")
+    options = parser.parse_args(args)
+    try:
+        added: int = save_games(generate(options.size, options.total, options.givens, options.difficulty,
+                                         options.seed), options.db)
+    except (InputError, SudokuError, DatabaseError) as error:
+        sys.exit(str(error))
+    print(f"{added} new games added to the database")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,27 @@ import sys
 import os
 import time
 import re
-import pandas as pd
 from colorama import Fore, Style, Back, just_fix_windows_console
 import platform
 from pathlib import Path
+from math import isqrt
+from typing import TYPE_CHECKING
 from sudoku import Sudoku, Solution, InputError, SudokuError
-from data import Database
+from data import Database, DatabaseError
+from render import Board, GREEN, RED
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _entered(user_input: str) -> str:
+    """ function _entered accepts a str entered by the user (a command, a game size or a sudoku string) and
+    returns it in lowercase, except for the sudoku strings of sizes whose symbols include uppercase letters
+    (36 by 36 and bigger) that are returned as they were entered"""
+    size: int = user_input.count("|") + 1 if "|" in user_input else isqrt(len(user_input))
+    if Sudoku.valid_size(size) and Sudoku.symbols(size) != Sudoku.symbols(size).lower():
+        return user_input
+    return user_input.lower()
 
 
 def _read(game_value: str) -> tuple | str:
@@ -31,12 +46,15 @@ def _read(game_value: str) -> tuple | str:
         return str(was_valid), read_game
 
 
-def _solve(game_object: Solution, max_time: float = 3) -> tuple | SudokuError | InputError:
+def _solve(game_object: Solution, max_time: float = 3, engine: str | None = None) -> tuple | SudokuError | InputError:
     game_object.max_time = max_time
     """ function _read accepts a sudoku solution object and a max_time optional parameter as arguments
     (defines the time limit the program has to solve a sudoku before returning a time out error) 
-    and returns a tuple from the solution object with additional information about the solved game"""
+    and returns a tuple from the solution object with additional information about the solved game,
+    the solving engine can be set with the engine argument otherwise it is chosen by the sudoku size
+    (dancing links for 16x16 sudokus)"""
     try:
+        game_object.engine = engine if engine is not None else ("dlx" if game_object.size > 9 else "propagation")
         game_object.solve()
     except (InputError, SudokuError) as error:
         return error
@@ -44,6 +62,18 @@ def _solve(game_object: Solution, max_time: float = 3) -> tuple | SudokuError |
         return str(game_object), game_object.extra_info(raw_level=True), game_object.stringify()
 
 
+def _is_unique(game_object: Solution) -> bool | None:
+    """ function _is_unique accepts a sudoku solution object and returns True if its sudoku has only one
+    solution, False if it has many or none and None if it can't be checked under the object time limit,
+    only sudokus with True are saved to the database"""
+    try:
+        return game_object.is_unique()
+    except InputError:
+        return False
+    except SudokuError as error:
+        return None if error.time else False
+
+
 def _choose_game(choose_value: str, db_path: str) -> int | tuple:
     """ function _choose_game accept as arguments choose_value (str from the user)
     and a valid path like str where the database with the sudokus is located and return 0 if no games
@@ -78,27 +108,28 @@ def _play(games: tuple[Sudoku, Sudoku]) -> None:
           "To stop playing enter 000.")
     starting_place.read()
     ending_place.read()
-    print("\n", starting_place, "\n")
-    board = str(starting_place)
+    # only the cells played are drawn again after each move
+    board = Board(starting_place.size, (value or "-" for value in starting_place.grid))
+    print("\n", board, "\n")
     star_val = set("".join(list(map(Solution.tr, val.values()))) for val in starting_place.initial_numbers())
     end_val = set("".join(list(map(Solution.tr, val.values()))) for val in ending_place.initial_numbers())
     valid_moves: list = list(end_val - star_val)
-    right_answers: list = []
     while True:
-        new_play = input("next move (000 to quit game): ").strip().lower()
+        new_play = input("next move (000 to quit game): ").strip()
+        if Solution.symbols(starting_place.size) == Solution.symbols(starting_place.size).lower():
+            new_play = new_play.lower()
         if new_play != "000":
             move: list = _valid_play(new_play, starting_place.size)
             if move:
                 if new_play in valid_moves:
                     valid_moves.remove(new_play)
-                    right_answers.append(move)
-                    board = _add_color(values=right_answers, object_=board)
+                    board.set((move[0] - 1) * starting_place.size + move[1] - 1, move[2], GREEN)
                     print("\n", board)
                     if not valid_moves:
                         print("Game solved.")
                         return
                 elif new_play[0:-1] in [val[0:-1] for val in valid_moves]:
-                    board = _add_color(values=[move], object_=board, right=False)
+                    board.set((move[0] - 1) * starting_place.size + move[1] - 1, move[2], RED)
                     print("\n", board)
 
                 else:
@@ -110,48 +141,13 @@ def _play(games: tuple[Sudoku, Sudoku]) -> None:
             return
 
 
-def _add_color(values: list, object_: str, right: bool = True) -> str:
-    """ function _add_color is responsable for adding color to the current sudoku
-    the user is playing (on a command line interface), adding red on the sudoku if
-    the user input is not part of the game solution and green if it is, as arguments this function
-    accepts a list of values to be colored, a str that is the current game being played and a bool value
-    use to know if the lis of values are correct or incorrect plays
-    """
-    game_rows = [item.split()[1:] for item in object_.split("\n") if item][1:]
-    for to_change in values:
-        game_rows[to_change[0] - 1][to_change[1] - 1] = Fore.GREEN + str(to_change[2]) + \
-                                                        Style.RESET_ALL if right \
-                                                        else Fore.RED + str(to_change[2]) + Style.RESET_ALL
-    head = f"{' ' * (len(str(len(game_rows))) + 3)}"
-    head += f"{''.join([f' col{val}' for val in range(1, len(game_rows) + 1)])}\n"
-    for count, row in enumerate(game_rows, 1):
-        head += f"row{count}{' ' * (3 - len(str(count)))}" if len(game_rows) > 9 else f"row{count} "
-        for step, val_item in enumerate(row, 1):
-            head += _item_format(val_item, step)
-        head += "\n"
-    return head
-
-
-def _item_format(item: str, position: int) -> str:
-    """ function _item_format accepts as arguments a str that is the  value inside
-    a cell of the current game and an int that is the position of that cell inside a row
-    and used them to properly format the game when is printed, the new format cell value
-    is returned as a str"""
-    if len(item) > 2:
-        number = re.search(r"m([1-9]|1[0-6])\x1b", item)[1]
-        return f"{' ' * (3 + len(str(position)) - len(number))}{item} "
-    else:
-        return f"{' ' * (3 + len(str(position)) - len(item))}{item} "
-
-
 def _valid_play(play_input: str, sudoku_size: int) -> list:
     """ function _valid_play accepts as argument a str that is the user input and an int that represents
     the size of the current played game to then return an empty list if the user input doesn't have
     the format of a valid sudoku play (not an incorrect play just not a valid one) and returns a list with the
     coordinates to find that cell inside the current game (to latter verify if the play was an incorrect or correct
     answer) if the play was valid"""
-    current_size = {4: "^[1-4]{3}$", 9: "^[1-9]{3}$", 16: "^(?:[1-9]|[a-g]){3}$"}
-    if re.search(current_size[sudoku_size], play_input) is not None:
+    if re.search(f"^[{Solution.symbols(sudoku_size)}]{{3}}$", play_input) is not None:
         return [Solution.tr(coord) for coord in play_input]
     else:
         return []
@@ -170,6 +166,29 @@ def _save_game(query: tuple, database_location: str, test: bool = False) -> bool
         return False
 
 
+def _saved_game(start_str: str, database_location: str) -> tuple | None:
+    """function _saved_game accepts the start string of a game and a path like str where the database with
+    the sudokus is located and returns the solution string, the number of initial values and the difficulty
+    saved for that game as a tuple or None if the game is not in the database (or the database has no sudokus
+    table yet), so a game solved before is not solved again"""
+    try:
+        with Database(db_path=database_location) as read_entry:
+            return next(read_entry.read_db(entries=("SELECT end_str, init_vals, difficulty FROM sudokus "
+                                                    "WHERE start_str = ? LIMIT 1", [start_str])), None)
+    except DatabaseError:
+        return None
+
+
+def _index_games(database_location: str) -> None:
+    """function _index_games creates if missing the index on the start strings of the sudokus table that
+    the _saved_game function looks games up with, nothing is done if the database has no sudokus table"""
+    try:
+        with Database(db_path=database_location) as add_index:
+            add_index.write_db("CREATE INDEX IF NOT EXISTS sudokus_start_str ON sudokus (start_str)")
+    except DatabaseError:
+        pass
+
+
 def main(db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku_table.db"))) -> None:
     """ function main accepts as is only argument a path like str where the database used by
     this program to save and read sudoku games is located and the purpose of the function is
@@ -179,14 +198,16 @@ def main(db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku
         just_fix_windows_console()
     print(f"{Back.LIGHTRED_EX}{Fore.BLACK}Welcome "
           f"to {Fore.LIGHTWHITE_EX}S{Fore.BLACK}udoku{Fore.LIGHTWHITE_EX}S{Fore.BLACK}olver{Style.RESET_ALL}")
+    _index_games(db_file)
     while True:
         play_or_solve = input("\nEnter p to play or s to solve, anything else to exit: ").lower().strip()
         if play_or_solve == "s":
             was_time_out: str | None = None
             while True:
-                game_size_or_sequence = input("\nEnter a valid game size or sequence, "
-                                              "n to go back: ").lower().strip()
-                if game_size_or_sequence in ("4", "9", "16"):
+                game_size_or_sequence = _entered(input("\nEnter a valid game size or sequence, "
+                                                       "n to go back: ").strip())
+                if len(game_size_or_sequence) <= 2 and Sudoku.valid_size(int(game_size_or_sequence)
+                                                                          if game_size_or_sequence.isdigit() else 0):
                     Sudoku.enter_game(sudoku_df=int(game_size_or_sequence))
                     time.sleep(3)
                     proceed = input("\nEnter your game, when rady enter y to "
@@ -200,6 +221,16 @@ def main(db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku
                     print(new_game)
                 else:
                     print(f"\n{new_game[0]}")
+                    start_str: str = new_game[1].stringify()["start"]
+                    saved: tuple | None = _saved_game(start_str, db_file)
+                    if saved is not None:
+                        game_info = list(f"{val[0]}: {val[1]}" for val in
+                                         zip(("game starting values", "game solving time", "game difficulty",
+                                              "game start id", "game solution id"),
+                                             (saved[1], "already in the database", saved[2], start_str, saved[0])))
+                        print(f"\n{Sudoku(sudoku_size=saved[0])}\n", *game_info, sep="\n")
+                        was_time_out = None
+                        continue
                     if game_size_or_sequence == was_time_out:
                         set_time: str | int = input("\nEnter your time (number) from 5 to 30 minutes anything "
                                                     "else will default the time to 5 minutes: ").strip()
@@ -223,7 +254,13 @@ def main(db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku
                                             "init_vals, difficulty, size) VALUES (?, ?, ?, ?, ?)",
                                             (solution[2]["start"], solution[2]["end"],
                                              solution[1]["start_vals"], solution[1]["difficulty"], new_game[1].size))
-                        if _save_game(new_query, db_file):
+                        unique: bool | None = _is_unique(new_game[1])
+                        if unique is None:
+                            print("\ncouldn't check that this game has only one solution within the time limit, "
+                                  "it was not added to the database")
+                        elif not unique:
+                            print("\nthis game has more than one solution, it was not added to the database")
+                        elif _save_game(new_query, db_file):
                             print("\nnew game added to database, copy the start id or "
                                   "solution id if you want to play it")
                     else:
@@ -233,18 +270,19 @@ def main(db_file=str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\sudoku
                             print("\nif you try to play this game immediately again you can change the time limit")
         elif play_or_solve == "p":
             while True:
-                random_or_id = input("\nEnter r to choose a random game, enter "
-                                     "a valid id or n to go back: ").lower().strip()
+                random_or_id = _entered(input("\nEnter r to choose a random game, enter "
+                                              "a valid id or n to go back: ").strip())
                 if random_or_id == "n":
                     break
                 elif random_or_id == "r":
                     while True:
-                        all_sizes = input("\nEnter from what sizes (4, 9 or 16) to choose randomly,\n"
+                        all_sizes = input("\nEnter from what sizes (4, 9, 16, 25...) to choose randomly,\n"
                                           "for all sizes enter all for one sizes enter the numbers,\n"
                                           "to select from all except one size enter minus next to\n"
                                           "excluded size(eg. -16 to select randomly from 4 and"
                                           " 9 only) and to go back enter anything else: ").strip().lower()
-                        if all_sizes in ["4", "9", "16", "all", "-4", "-9", "-16"]:
+                        if all_sizes == "all" or (all_sizes.lstrip("-").isdigit() and len(all_sizes.lstrip("-")) <= 2
+                                                  and Sudoku.valid_size(int(all_sizes.lstrip("-")))):
                             while True:
                                 present_game: tuple[Solution, Solution] = _choose_game(all_sizes, db_file)
                                 if present_game != 0:
@@ -0,0 +1,49 @@
+import functools
+from typing import Iterable
+from colorama import Fore, Style
+
+# colors a cell can be drawn with, found values and right plays in green and errors and wrong plays in red
+GREEN: str = Fore.GREEN
+RED: str = Fore.RED
+
+
+@functools.cache
+def _frame(size: int) -> tuple[str, tuple[str], tuple[int]]:
+    """ function _frame returns the parts of a board of the given size that never change, the column header,
+    the label of every row and the width of the cells of every column, they are built once per size"""
+    header: str = f"{' ' * (len(str(size)) + 3)}{''.join(f' col{col}' for col in range(1, size + 1))}\n"
+    labels: tuple[str] = tuple(f"row{row}{' ' * (3 - len(str(row)))}" if size > 9 else f"row{row} "
+                               for row in range(1, size + 1))
+    widths: tuple[int] = tuple(3 + len(str(col)) for col in range(1, size + 1))
+    return header, labels, widths
+
+
+class Board:
+    """ class Board draws a sudoku board on a command line, values holds what is shown in every cell row by
+    row (the value or - for empty cells) and colors the color of the cells that have one (cell number: color).
+    The board is kept as a list with a piece of text for the header, the label of every row, every cell and
+    every line break, so changing a cell only formats that cell again and drawing the board is one join"""
+
+    def __init__(self, size: int, values: Iterable[int | str], colors: dict[int: str] | None = None):
+        self.size: int = size
+        header, labels, self.widths = _frame(size)
+        self.pieces: list[str] = [header] + [""] * (size * (size + 2) - 1)
+        for row in range(size):
+            self.pieces[1 + row * (size + 2)] = labels[row]
+            if row < size - 1:
+                self.pieces[(row + 1) * (size + 2)] = "\n"
+        for cell, value in enumerate(values):
+            self.set(cell, value, colors.get(cell) if colors else None)
+
+    def set(self, cell: int, value: int | str, color: str | None = None) -> None:
+        """ method set changes what is shown in a cell (row * size + col counting from 0) and its color"""
+        row, col = divmod(cell, self.size)
+        text: str = str(value)
+        # the last cell of a row has no space after it
+        end: str = " " if col < self.size - 1 else ""
+        padding: str = " " * (self.widths[col] - len(text))
+        self.pieces[2 + row * (self.size + 2) + col] = (f"{padding}{color}{text}{Style.RESET_ALL}{end}" if color
+                                                        else f"{padding}{text}{end}")
+
+    def __str__(self) -> str:
+        return "".join(self.pieces)
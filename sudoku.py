@@ -1,38 +1,436 @@
 """libraries used by this program"""
 
-import pandas as pd
 import os
 import re
 import time
 import platform
-import copy
 import sys
+import threading
+import functools
+import random
+from array import array
 from pathlib import Path
-from more_itertools import flatten, unique_to_each, duplicates_everseen
-from colorama import Fore, Style, just_fix_windows_console
-from math import sqrt, ceil
+from typing import Iterable, Iterator, TYPE_CHECKING
+from math import sqrt, isqrt
+from itertools import islice, chain
+
+# pandas, colorama and the process pool are only needed to show games or to search in parallel, they are
+# imported the first time they are used so solving a game from a script doesn't have to load them
+if TYPE_CHECKING:
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor
+
+
+class Layout:
+    """ class Layout holds the cell tables of a sudoku size that never change between games: the cells of
+    every row, column and quadrant (units), the three units each cell belongs to and the peers of each cell
+    (every other cell sharing a row, column or quadrant with it), cells are numbered row * size + col from 0"""
+
+    def __init__(self, size: int):
+        self.size: int = size
+        self.base: int = int(sqrt(size))
+        cells: range = range(size ** 2)
+        self.rows: tuple[tuple[int]] = tuple(tuple(cell for cell in cells if cell // size == row)
+                                             for row in range(size))
+        self.cols: tuple[tuple[int]] = tuple(tuple(cell for cell in cells if cell % size == col)
+                                             for col in range(size))
+        self.quadrants: tuple[tuple[int]] = tuple(tuple(cell for cell in cells if self.quadrant(cell) == quadrant)
+                                                  for quadrant in range(size))
+        # units of each cell ordered as row, column, quadrant like the characters of a cell key
+        self.cell_units: tuple[tuple[tuple[int]]] = tuple((self.rows[cell // size], self.cols[cell % size],
+                                                           self.quadrants[self.quadrant(cell)]) for cell in cells)
+        self.units: tuple[tuple[int]] = self.rows + self.cols + self.quadrants
+        self.peers: tuple[tuple[int]] = tuple(tuple(sorted(set(chain.from_iterable(self.cell_units[cell])) - {cell}))
+                                              for cell in cells)
+        self.peer_sets: tuple[frozenset[int]] = tuple(frozenset(peers) for peers in self.peers)
+        # (unit number inside units, position of the cell inside that unit) for the row, column and quadrant
+        self.cell_places: tuple[tuple[tuple[int, int]]] = tuple(
+            tuple((number, self.units[number].index(cell))
+                  for number in (cell // size, size + cell % size, 2 * size + self.quadrant(cell)))
+            for cell in cells)
+        self.keys: tuple[str] = tuple(f"{Sudoku.tr(cell // size + 1)}{Sudoku.tr(cell % size + 1)}"
+                                      f"{Sudoku.tr(self.quadrant(cell) + 1)}" for cell in cells)
+        # a random 64 bit number for every cell and value (cell * size + value - 1), the zobrist key of a game
+        # is the xor of the numbers of its placed values, the seed keeps the keys the same between runs
+        keys_rng = random.Random(size)
+        self.zobrist: tuple[int] = tuple(keys_rng.getrandbits(64) for _ in range(size ** 3))
+        # smallest array type that holds a mask of size bits, search nodes keep their masks packed with it
+        self.typecode: str = next(code for code in "BHILQ" if array(code).itemsize * 8 >= size)
+
+    def quadrant(self, cell: int) -> int:
+        """ method quadrant returns the quadrant (counting from 0) a cell belongs to"""
+        return self.base * (cell // self.size // self.base) + cell % self.size // self.base
+
+    def key(self, values: Iterable[int]) -> int:
+        """ method key returns the zobrist key of a game from its values (0 for empty cells)"""
+        key: int = 0
+        for cell, value in enumerate(values):
+            if value:
+                key ^= self.zobrist[cell * self.size + value - 1]
+        return key
+
+    def __deepcopy__(self, memo: dict):
+        # the tables are read only so every copy of a game shares them
+        return self
+
+
+class Candidates:
+    """ class Candidates keeps the possible values of every sudoku cell as an integer bitmask (bit n - 1 is set
+    while n is still a possible value) indexed by the flat cell number (row * size + col counting from 0),
+    solved cells keep their value and an empty mask and a running counter of unsolved cells is kept so the
+    solver never has to scan the whole board to know if a game has been solved, every change is written
+    to a trail so a guess can be tried in place and rolled back instead of copying the whole game.
+    For every unit and value the positions inside the unit where the value can still go are kept too
+    (places list indexed by unit number * size + value - 1) so hidden singles are found as they appear"""
+
+    __slots__ = ("size", "layout", "masks", "values", "unsolved", "places", "singles", "hidden", "dead", "trail",
+                 "placed", "removed")
+
+    def __init__(self, size: int):
+        self.size: int = size
+        self.layout: Layout = LAYOUTS[size]
+        self.masks: list[int] = [(1 << size) - 1] * size ** 2
+        self.values: list[int] = [0] * size ** 2
+        self.unsolved: int = size ** 2
+        self.places: list[int] = [(1 << size) - 1] * 3 * size ** 2
+        self.singles: list[int] = []
+        self.hidden: list[int] = []
+        self.dead: bool = False
+        # (cell, mask before the change, places of the value before the change) for every placed value
+        # or (cell, mask before the change, None) for every removed possibility
+        self.trail: list[tuple[int, int, tuple | None]] = []
+        # values placed and possibilities removed so far, rollbacks don't undo them as they count work done
+        self.placed: int = 0
+        self.removed: int = 0
+
+    @staticmethod
+    def options(mask: int) -> tuple:
+        """ static method options returns as a tuple the values (1 to size) encoded inside a bitmask"""
+        found: list[int] = []
+        while mask:
+            low_bit: int = mask & -mask
+            found.append(low_bit.bit_length())
+            mask ^= low_bit
+        return tuple(found)
+
+    def place(self, cell: int, value: int) -> bool:
+        """ method place sets a cell to a value and removes that value as a possibility of every
+        kin cell (same row, column or quadrant), returns False if the play was an invalid guess"""
+        if self.values[cell]:
+            return self.values[cell] == value
+        bit: int = 1 << (value - 1)
+        if not self.masks[cell] & bit:
+            self.dead = True
+            return False
+        mask: int = self.masks[cell]
+        places: list[int] = self.places
+        self.trail.append((cell, mask, tuple(places[unit * self.size + value - 1]
+                                             for unit, _ in self.layout.cell_places[cell])))
+        self.values[cell] = value
+        self.masks[cell] = 0
+        self.unsolved -= 1
+        self.placed += 1
+        others: tuple = self.options(mask & ~bit)
+        for unit, position in self.layout.cell_places[cell]:
+            places[unit * self.size + value - 1] = 0
+            for other in others:
+                if not self.__leave(unit * self.size + other - 1, position):
+                    return False
+        masks: list[int] = self.masks
+        for kin in self.layout.peers[cell]:
+            if masks[kin] & bit and not self.remove(kin, value):
+                return False
+        return True
+
+    def remove(self, cell: int, value: int) -> bool:
+        """ method remove deletes a value as a possibility of an unsolved cell, returns False
+        if the cell is left without possibilities"""
+        mask: int = self.masks[cell] & ~(1 << (value - 1))
+        if mask == self.masks[cell]:
+            return True
+        self.trail.append((cell, self.masks[cell], None))
+        self.masks[cell] = mask
+        self.removed += 1
+        if not mask:
+            self.dead = True
+            return False
+        if not mask & (mask - 1):
+            self.singles.append(cell)
+        for unit, position in self.layout.cell_places[cell]:
+            index: int = unit * self.size + value - 1
+            if self.places[index] and not self.__leave(index, position):
+                return False
+        return True
+
+    def __leave(self, index: int, position: int) -> bool:
+        """ private method leave deletes a position from the places where a value can go inside a unit,
+        returns False if the value is left without places"""
+        place: int = self.places[index] & ~(1 << position)
+        self.places[index] = place
+        if not place:
+            self.dead = True
+            return False
+        if not place & (place - 1):
+            self.hidden.append(index)
+        return True
+
+    def next_single(self) -> int | None:
+        """ method next_single returns the next cell that has only one possibility left or None
+        if there is not any"""
+        while self.singles:
+            cell: int = self.singles.pop()
+            if self.masks[cell] and not self.masks[cell] & (self.masks[cell] - 1):
+                return cell
+        return None
+
+    def next_hidden(self) -> tuple[int, int] | None:
+        """ method next_hidden returns as (cell, value) the next value that can only go in one cell of a
+        unit (hidden single) or None if there is not any"""
+        while self.hidden:
+            index: int = self.hidden.pop()
+            place: int = self.places[index]
+            if place and not place & (place - 1):
+                cell: int = self.layout.units[index // self.size][place.bit_length() - 1]
+                if self.masks[cell] & (1 << index % self.size):
+                    return cell, index % self.size + 1
+        return None
+
+    def checkpoint(self) -> int:
+        """ method checkpoint returns the current length of the trail, passing it to the rollback
+        method undoes every change made after this call"""
+        return len(self.trail)
+
+    def rollback(self, mark: int) -> None:
+        """ method rollback undoes the changes written to the trail after the checkpoint mark,
+        the game is left as it was when the checkpoint was taken"""
+        trail, masks, values, places = self.trail, self.masks, self.values, self.places
+        size, cell_places = self.size, self.layout.cell_places
+        while len(trail) > mark:
+            cell, mask, saved = trail.pop()
+            restored: int = mask & ~masks[cell]
+            while restored:
+                low_bit: int = restored & -restored
+                restored ^= low_bit
+                for unit, position in cell_places[cell]:
+                    places[unit * size + low_bit.bit_length() - 1] |= 1 << position
+            masks[cell] = mask
+            if saved is not None:
+                # the places of the value were cleared when it was placed, they are set back as they were
+                for (unit, _), unit_places in zip(cell_places[cell], saved):
+                    places[unit * size + values[cell] - 1] = unit_places
+                values[cell] = 0
+                self.unsolved += 1
+        self.singles.clear()
+        self.hidden.clear()
+        self.dead = False
+
+    def restore(self, node: "SearchNode") -> None:
+        """ method restore sets the game to the candidate state saved inside a search node"""
+        self.masks[:] = node.masks
+        self.values[:] = node.values
+        self.places[:] = node.places
+        self.unsolved = node.unsolved
+        self.trail.clear()
+        self.singles.clear()
+        self.hidden.clear()
+        self.dead = False
+
+
+class SearchNode:
+    """ class SearchNode is a branch of the search frontier, it keeps the candidate state the branch reached
+    (so expanding it does not need to replay the branch from the start), the cell the branch splits on and
+    the values still possible for that cell, the moves (value, cell) that led to the branch from its parent
+    node and the parent itself so the whole path can be rebuilt once a solution is found. Frontiers can
+    hold hundreds of thousands of nodes so the state is packed into arrays of the smallest type that fits
+    (a few bytes per cell instead of a list of int objects) and the moves into a flat array of value, cell
+    pairs"""
+
+    __slots__ = ("masks", "values", "places", "unsolved", "cell", "options", "moves", "parent")
+
+    def __init__(self, game: Candidates, cell: int, options: tuple, moves: tuple = (),
+                 parent: "SearchNode | None" = None):
+        typecode: str = game.layout.typecode
+        self.masks: array | None = array(typecode, game.masks)
+        self.values: array | None = array("B", game.values)
+        self.places: array | None = array(typecode, game.places)
+        self.unsolved: int = game.unsolved
+        self.cell: int = cell
+        self.options: tuple = options
+        self.moves: array = array("H", chain.from_iterable(moves))
+        self.parent: SearchNode | None = parent
+
+    def release(self) -> None:
+        """ method release drops the saved candidate state once the node has been expanded, only
+        the moves are kept to rebuild the path"""
+        self.masks = None
+        self.values = None
+        self.places = None
+
+    def __getstate__(self) -> tuple:
+        """ private method getstate leaves the parent out when a node is sent to a worker process, the
+        parent chain is kept by the process that owns the search and linked back when the node returns"""
+        return tuple(None if name == "parent" else getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """ private method setstate rebuilds a node sent to or from a worker process"""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def path(self) -> list[tuple[int, int]]:
+        """ method path returns the moves (value, cell) made from the start of the search to this node"""
+        node: SearchNode | None = self
+        moves: list[tuple[int, int]] = []
+        while node is not None:
+            moves[:0] = zip(node.moves[::2], node.moves[1::2])
+            node = node.parent
+        return moves
+
+
+class DancingLinks:
+    """ class DancingLinks encodes the unsolved part of a sudoku as an exact cover problem (each cell,
+    row-value, column-value and quadrant-value constraint must be covered by exactly one cell and value
+    choice) and searches it with Knuth's algorithm X using dancing links, the links of the matrix are
+    kept in flat lists of node numbers instead of node objects to keep the search loop cheap"""
+
+    def __init__(self, game: Candidates):
+        size: int = game.size
+        layout: Layout = game.layout
+        cells: int = size ** 2
+        # every constraint still open is a column, the ones already met by placed values are left out
+        open_constraints: list[int] = []
+        for cell in range(cells):
+            if not game.values[cell]:
+                open_constraints.append(cell)
+        for offset, units in ((cells, layout.rows), (2 * cells, layout.cols), (3 * cells, layout.quadrants)):
+            for index, unit in enumerate(units):
+                placed: set = {game.values[cell] for cell in unit}
+                open_constraints.extend(offset + index * size + value - 1
+                                        for value in range(1, size + 1) if value not in placed)
+        header: dict[int: int] = {constraint: node for node, constraint in enumerate(open_constraints, start=1)}
+        total: int = len(open_constraints)
+        # node 0 is the root and nodes 1 to total are the column headers
+        self.left: list[int] = [total] + list(range(total))
+        self.right: list[int] = list(range(1, total + 1)) + [0]
+        self.up: list[int] = list(range(total + 1))
+        self.down: list[int] = list(range(total + 1))
+        self.column: list[int] = list(range(total + 1))
+        self.count: list[int] = [0] * (total + 1)
+        self.choice: list[tuple[int, int] | None] = [None] * (total + 1)
+        self.nodes: int = 0
+        for cell in range(cells):
+            for value in game.options(game.masks[cell]):
+                self.__add_row((cell, value), (header[cell],
+                                               header[cells + (cell // size) * size + value - 1],
+                                               header[2 * cells + (cell % size) * size + value - 1],
+                                               header[3 * cells + layout.quadrant(cell) * size + value - 1]))
+
+    def __add_row(self, choice: tuple[int, int], columns: tuple) -> None:
+        """ private method add_row links a new row (one cell and value choice) at the bottom
+        of every column that choice covers"""
+        first: int = len(self.column)
+        for place, col in enumerate(columns):
+            node: int = first + place
+            self.left.append(first + (place - 1) % len(columns))
+            self.right.append(first + (place + 1) % len(columns))
+            self.up.append(self.up[col])
+            self.down.append(col)
+            self.down[self.up[col]] = node
+            self.up[col] = node
+            self.column.append(col)
+            self.choice.append(choice)
+            self.count[col] += 1
+
+    def search(self, check: "callable | None" = None):
+        """ method search is a generator that yields every solution of the exact cover problem as a tuple
+        of (cell, value) choices, choosing always the column with the fewest rows left, if check is passed
+        it gets called with the number of rows tried every 256 rows and it can raise to stop the search"""
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, count = self.column, self.count
+
+        def cover(col: int) -> None:
+            left[right[col]] = left[col]
+            right[left[col]] = right[col]
+            row = down[col]
+            while row != col:
+                node = right[row]
+                while node != row:
+                    up[down[node]] = up[node]
+                    down[up[node]] = down[node]
+                    count[column[node]] -= 1
+                    node = right[node]
+                row = down[row]
+
+        def uncover(col: int) -> None:
+            row = up[col]
+            while row != col:
+                node = left[row]
+                while node != row:
+                    count[column[node]] += 1
+                    up[down[node]] = node
+                    down[up[node]] = node
+                    node = left[node]
+                row = up[row]
+            left[right[col]] = col
+            right[left[col]] = col
+
+        chosen: list[int] = []
+        while True:
+            if right[0] == 0:
+                yield tuple(self.choice[row] for row in chosen)
+                row = None
+            else:
+                col = right[0]
+                best = col
+                while col != 0:
+                    if count[col] < count[best]:
+                        best = col
+                        if count[col] < 2:
+                            break
+                    col = right[col]
+                cover(best)
+                row = down[best]
+            # go to the next row of the current column, backtracking while a column runs out of rows
+            while True:
+                if row is not None and row != column[row]:
+                    self.nodes += 1
+                    if check is not None and not self.nodes & 255:
+                        check(256)
+                    chosen.append(row)
+                    node = right[row]
+                    while node != row:
+                        cover(column[node])
+                        node = right[node]
+                    break
+                if row is not None:
+                    uncover(row)
+                if not chosen:
+                    return
+                row = chosen.pop()
+                node = left[row]
+                while node != row:
+                    uncover(column[node])
+                    node = left[node]
+                row = down[row]
 
 
 class Sudoku:
     """ class Sudoku it's responsable for making sure that
-    a valid sudoku has been submitted before attempting to solve it"""
+    a valid sudoku has been submitted before attempting to solve it, the game is kept as a flat array of
+    its values (grid, 0 for empty cells) and the sudoku dataframe is only built when it's asked for"""
     read_input_from: str = str(Path(fr"{os.path.abspath(os.path.dirname(__file__))}\input.txt"))
 
-    def __init__(self, sudoku_size: int | str | pd.DataFrame = 9, letters: bool = False, sudoku_color: bool = False):
-        # set pandas values to allow the display of dataframes in console or as a string
-        # for 16x16 sudokus
-        pd.set_option("display.max_columns", 16)
-        pd.set_option("display.max_rows", 16)
-        pd.set_option("display.width", 120)
+    def __init__(self, sudoku_size: "int | str | pd.DataFrame" = 9, letters: bool = False, sudoku_color: bool = False):
+        self.grid: array | None = None
         self.sudoku: None | pd.DataFrame = None
         self.size = sudoku_size
         self.letters = letters
         self.color = sudoku_color
-        self.unknown_values: dict[str: list[int]] = {}
+        self.unknown_values: Candidates = Candidates(self.size)
         self.initial_values: dict[str: list[int]] = {}
         self.verified: bool = False
         if self.color and platform.system() == "Windows":
             # allows the display of colored string in a windows console
+            from colorama import just_fix_windows_console
             just_fix_windows_console()
 
     @property
@@ -59,60 +457,64 @@ class Sudoku:
             raise InputError("Expected type value for class Sudoku letters argument of bool, "
                              f"\ninstead you set color to an argument of type {type(value)}.")
 
+    @property
+    def sudoku(self) -> "pd.DataFrame | None":
+        if self._sudoku is None and self.grid is not None:
+            self._sudoku = self._to_frame(self.grid)
+        return self._sudoku
+
+    @sudoku.setter
+    def sudoku(self, value: "pd.DataFrame | None") -> None:
+        # a dataframe set here is the game to read, it replaces the grid until it has been read
+        self._sudoku = value
+        if value is not None:
+            self.grid = None
+
     @property
     def size(self) -> int:
         return self._size
 
     @size.setter
-    def size(self, value: int | str | pd.DataFrame) -> None:
+    def size(self, value: "int | str | pd.DataFrame") -> None:
         if isinstance(value, int):
-            if value in (4, 9, 16):
+            if self.valid_size(value):
                 self._size = value
             else:
                 raise InputError("Invalid value for class Sudoku size argument, "
-                                 f"\nexpected values: 4, 9, 16 your value: {value}.")
+                                 f"\nexpected a square number from 4 to {_MAX_SIZE} your value: {value}.")
         elif isinstance(value, str):
-            if re.search("^(?:[1-4]|-){16}|(?:[1-9]|-){81}|(?:[1-9]|[a-g]|-){256}$",
-                         value) is not None:
-                self.size = int(sqrt(len(value)))
-                game = self.__create_template()
-                current_row = 1
-                for count, sudo_value in enumerate(value, start=1):
-                    if sudo_value != "-":
-                        game.at[f"row{current_row}",
-                                f"col{count-self.size*(current_row-1)}"] = self.tr(sudo_value)
-                    if count % self.size == 0:
-                        current_row += 1
-                self.sudoku = game
-            elif re.search(r"^(?:(?:(?:[1-4]{2}){0,4}\|){3}(?:[1-4]{2}){0,4}|(?:(?:[1-9]{2}){0,9}\|){8}"
-                           "(?:[1-9]{2}){0,9}|(?:(?:(?:[1-9]|[a-g])"
-                           r"{2}){0,16}\|){15}(?:(?:[1-9]|[a-g]){2}){0,16})$", value) is not None:
-                self.size = len(value.split("|"))
-                game_rows = value.split("|")
-                game: pd.DataFrame = self.__create_template()
-                for count, row in enumerate(game_rows):
-                    if row:
-                        row = tuple((row[val:val+2]) for val in range(0, len(row), 2))
-                        for sudo_value in row:
-                            game.at[f"row{count + 1}", f"col{self.tr(sudo_value[0])}"] = self.tr(sudo_value[1])
-                self.sudoku = game
+            size, givens = _parse_game(value)
+            self.size = size
+            self.sudoku = None
+            self.grid = array("B", bytes(size ** 2))
+            for cell, sudo_value in givens:
+                self.grid[cell] = sudo_value
+        elif "pandas" in sys.modules and isinstance(value, sys.modules["pandas"].DataFrame):
+            df_shape = value.shape
+            if df_shape[0] == df_shape[1] and self.valid_size(df_shape[0]):
+                self._size = df_shape[0]
+                self.sudoku = value
             else:
                 raise InputError("Invalid value for class Sudoku size argument, "
-                                 f"\nexpected a valid sudoku string your value: {value}.")
-        elif isinstance(value, pd.DataFrame):
-            df_shape = value.shape
-            match df_shape:
-                case (4, 4) | (9, 9) | (16, 16):
-                    self._size = df_shape[0]
-                    self.sudoku = value
-                case _:
-                    raise InputError("Invalid value for class Sudoku size argument, "
-                                     "\nexpected a valid sudoku dataframe of shape (4, 4), "
-                                     f"(9, 9) or (16, 16), got dataframe of shape {df_shape} instead.")
+                                 "\nexpected a valid sudoku dataframe of shape (4, 4), "
+                                 f"(9, 9), (16, 16) up to ({_MAX_SIZE}, {_MAX_SIZE}), got dataframe of shape "
+                                 f"{df_shape} instead.")
         else:
             raise InputError("Invalid value for class Sudoku size argument, "
                              f"\nexpected value of type int, str or dataframe, got value type: {type(value)}.")
 
+    @staticmethod
+    def valid_size(size: int) -> bool:
+        """ static method valid_size returns True if size is a supported sudoku size, any square number n * n
+            from 4 on (so quadrants are n by n) whose values all have a symbol to be written in a sudoku string"""
+        return isinstance(size, int) and 4 <= size <= _MAX_SIZE and isqrt(size) ** 2 == size
+
+    @staticmethod
+    def symbols(size: int) -> str:
+        """ static method symbols returns the symbols used for the values 1 to size in sudoku strings, 1 to 9
+            followed by lowercase and then uppercase letters"""
+        return _SYMBOLS[:size]
+
     @classmethod
     def enter_game(cls, sudoku_df: int = 9) -> None:
         """class method enter_game, expects as argument sudoku_df of type int
@@ -123,79 +525,108 @@ class Sudoku:
             new_game.write(str(class_game))
         os.startfile(Sudoku.read_input_from, "open")
 
-    def read(self) -> pd.DataFrame:
-        """Sudoku class public read method: once a sudoku is in place (txt file from where sudokus are read)
-            this method validate the sudoku first by its format (dataframe str format); second that only has as initial
-            values 1-4 (sudoku size 4x4), 1-9 (sudoku size 9x9) or 1-16 or 1-9a-f (sudoku size 16x16); third that
-            the total amount of initial values it's at least 4, 17 or 55 depending on the sudoku size (4, 9 or 16) and
-            finally that there are not two equal initial values in a row, column or quadrant of the sudoku.
+    def read(self) -> "pd.DataFrame":
+        """Sudoku class public read method: once a sudoku is in place (given as a string or dataframe or else
+            completed in the txt file from where sudokus are read) this method validate the sudoku first by its
+            format (dataframe str format); second that only has as initial values 1-4 (sudoku size 4x4), 1-9
+            (sudoku size 9x9) or 1-16 or 1-9a-f (sudoku size 16x16); third that the total amount of initial values
+            it's at least 4, 17 or 55 depending on the sudoku size (4, 9 or 16) and finally that there are not two
+            equal initial values in a row, column or quadrant of the sudoku. Games given as a string or dataframe
+            are checked in memory, the txt file is only read for the template written by enter_game.
             If valid this method returns a dataframe with the initial numbers else it raises an InputError"""
+        self._load()
+        return self.sudoku
+
+    def _load(self) -> None:
+        """ private method load does the checks of the read method without building the sudoku dataframe,
+            the values read are left in the grid and the initial values and candidates are set from them"""
         initial_values: int = 0
-        if self.sudoku is not None:
-            with open(Sudoku.read_input_from, "w") as put_game:
-                put_game.write(str(self.sudoku))
+        given_cells: list[tuple[int, int]] = []
+        self.initial_values.clear()
+        self.unknown_values = Candidates(self.size)
+        if self.grid is not None:
+            rows: Iterator[list[int]] = (list(self.grid[row * self.size:(row + 1) * self.size])
+                                         for row in range(self.size))
+        elif self.sudoku is not None:
+            rows: Iterator[list[int]] = self.__game_rows()
         else:
-            self.sudoku: pd.DataFrame = self.__create_template()
+            rows: Iterator[list[int]] = self.__file_rows()
+        grid = array("B", bytes(self.size ** 2))
+        for count, line in enumerate(rows, 1):
+            fails: tuple[str] = tuple(str(val) for val in line if val > self.size)
+            if fails:
+                raise InputError(f"Max value for a sudoku starting numbers is {self.size} "
+                                 f"\nbut at row {count} you entered: "
+                                 f"{', '.join(fails)}.")
+            for position, user_input in enumerate(line, (count - 1) * self.size):
+                if user_input:
+                    initial_values += 1
+                    grid[position] = user_input
+                    self.initial_values[LAYOUTS[self.size].keys[position]] = [user_input]
+                    given_cells.append((position, user_input))
+        self.sudoku = None
+        self.grid = grid
+        if initial_values >= _min_givens(self.size):
+            self.__validate_sudoku()
+            for cell, value in given_cells:
+                self.unknown_values.place(cell, value)
+            self.verified = True
+        else:
+            raise InputError("The minimum amount of number to solve a sudoku of\n"
+                             f"size {self.size} is {_min_givens(self.size)} and your sudoku has {initial_values}.")
+
+    def __value(self, text: str) -> int:
+        """ private method value returns the value written in a cell of a game read as text, 0 if empty"""
+        if text == "-":
+            return 0
+        return int(text) if text.isdigit() else self.tr(text)
+
+    def __fold(self) -> bool:
+        """ private method fold returns True if letters are read as lowercase, which they are unless the size
+            uses uppercase letters as symbols too"""
+        symbols: str = self.symbols(self.size)
+        return symbols == symbols.lower()
+
+    def __game_rows(self) -> Iterator[list[int]]:
+        """ private method game_rows yields the values of every row of the sudoku dataframe, checking the same
+            format the txt file is checked for without writing the game to it"""
+        fold: bool = self.__fold()
+        if list(self.sudoku.columns) != [f"col{val}" for val in range(1, self.size + 1)]:
+            raise InputError("Invalid column sudoku format.")
+        if list(self.sudoku.index) != [f"row{val}" for val in range(1, self.size + 1)]:
+            raise InputError("There are invalid characters in your sudoku.")
+        for row in self.sudoku.itertuples(index=False):
+            line: list[str] = [str(val).strip().lower() if fold else str(val).strip() for val in row]
+            if not all(_CELL_FORMAT.match(val) for val in line):
+                raise InputError("There are invalid characters in your sudoku.")
+            yield [self.__value(val) for val in line]
+
+    def __file_rows(self) -> Iterator[list[int]]:
+        """ private method file_rows yields the values of every row of the game completed in the txt file
+            from where sudokus are read (the template written by enter_game) after checking its format"""
+        fold: bool = self.__fold()
         with open(Sudoku.read_input_from, "r") as get_game:
-            new_game = tuple(sentences.strip().lower() for sentences in get_game.readlines() if sentences.strip())
+            new_game = tuple(sentences.strip().lower() if fold else sentences.strip()
+                             for sentences in get_game.readlines() if sentences.strip())
         if len(new_game) != self.size + 1:
             raise InputError("Rows are missing or there are more than required "
                              "in your sudoku.")
         if new_game[0] != " ".join(tuple(f"col{val}" for val in range(1, self.size + 1))):
             raise InputError("Invalid column sudoku format.")
         for count, line in enumerate(new_game[1:], 1):
-            if re.search(fr"^row{count}\s+([1-9]\s+|1[0-6]\s+|[a-g]\s+|-\s+){{{self.size - 1}}}"
-                         "([1-9]|1[0-6]|[a-g]|-)$", line) is None:
+            if re.search(fr"^row{count}\s+([1-9][0-9]?\s+|[a-zA-Z]\s+|-\s+){{{self.size - 1}}}"
+                         "([1-9][0-9]?|[a-zA-Z]|-)$", line) is None:
                 raise InputError("There are invalid characters in your sudoku.")
-            values: list = line.split()[1:]
-            values: zip = zip(values, list(val for val in range((count - 1) * self.size + 1,
-                                                                self.size * count + 1)))
-            values: list = [(self.tr(val[0]), val[1]) if val[0] in ("a", "b", "c", "d", "e", "f", "g")
-                            else (val if "-" in val else (int(val[0]), val[1])) for val in values]
-            if all(tuple(map(lambda val: val <= self.size, (val[0] for val in values if "-" not in val)))):
-                for user_input, position in values:
-                    row: int = position//self.size if position % self.size == 0 else position//self.size + 1
-                    col: int = self.size if position % self.size == 0 else position % self.size
-                    quadrant = int(sqrt(self.size)) * (ceil(row / sqrt(self.size)) - 1) + ceil(col / sqrt(self.size))
-                    if user_input != "-":
-                        initial_values += 1
-                        self.sudoku.at[f"row{row}", f"col{col}"] = user_input
-                        self.initial_values[f"{self.tr(row)}{self.tr(col)}{self.tr(quadrant)}"] = [user_input]
-                    else:
-                        self.unknown_values[f"{self.tr(row)}{self.tr(col)}{self.tr(quadrant)}"] \
-                         = [val for val in range(1, self.size + 1)]
-            else:
-                fails = tuple(str(val[0]) for val in values if '-' not in val and val[0] > self.size)
-                raise InputError(f"Max value for a sudoku starting numbers is {self.size} "
-                                 f"\nbut at row {count} you entered: "
-                                 f"{', '.join(fails)}.")
-        # minimum number of initial values required for a sudoku to have a unique
-        # solution at the time of the writing of this program
-        min_vals: dict[int: int] = {4: 4, 9: 17, 16: 55}
-        if initial_values >= min_vals[self.size]:
-            self.__validate_sudoku()
-            for entry in self.initial_values:
-                to_remove = self.initial_values[entry][0]
-                entry_kin = {key: value for key, value in self.unknown_values.items() if self._filtro(key, entry)}
-                for child in entry_kin:
-                    if to_remove in entry_kin[child]:
-                        self.unknown_values[child].remove(to_remove)
-            if self.letters and self.size > 9:
-                self.sudoku = self._with_letters(self.sudoku)
-            self.verified = True
-            return self.sudoku
-        else:
-            raise InputError("The minimum amount of number to solve a sudoku of\n"
-                             f"size {self.size} is {min_vals[self.size]} and your sudoku has {initial_values}.")
+            yield [self.__value(val) for val in line.split()[1:]]
 
-    def __create_template(self) -> pd.DataFrame:
+    def __create_template(self) -> "pd.DataFrame":
         """ create_template private method generates a dataframe of dimensions according to the object size
             property """
         rows: list = [f"row{size}" for size in range(1, self.size + 1)]
         datos_tabla: dict = {}
         for a in range(1, self.size + 1):
             datos_tabla[f"col{a}"] = ["-"]
-        return pd.DataFrame(data=datos_tabla, index=rows)
+        return _pandas().DataFrame(data=datos_tabla, index=rows)
 
     def __check_game(self) -> dict | str:
         """ private method check_game scans the current game to check for number
@@ -209,7 +640,8 @@ class Sudoku:
                                    ("cols", 1), ("quadrants", 2)):
                 locations: dict[str:list] = {key: val for key, val in self.initial_values.items()
                                              if key[pattern] == size_category}
-                has_repetition: tuple = tuple(duplicates_everseen(locations.values()))
+                found: list = list(locations.values())
+                has_repetition: tuple = tuple(value for index, value in enumerate(found) if value in found[:index])
                 if has_repetition:
                     for sub_error in has_repetition:
                         location: list = [key for key, value in locations.items() if value == sub_error]
@@ -265,8 +697,6 @@ class Sudoku:
                                            f"col{self.tr(error[1])}"] \
                                 = f">{self.__change(self.initial_values[error][0])}"
             error_log.sort(key=lambda x: x["row"] + x["col"])
-            if self.letters and self.size > 9:
-                self.sudoku = self._with_letters(self.sudoku)
             if self.color:
                 raise InputError(*messages, game=self.__error_color(*has_error["total"]),
                                  values=error_log)
@@ -281,14 +711,14 @@ class Sudoku:
     def tr(value: int | str) -> int | str:
         """ tr static method coverts numeric values from int to str so
             numeric values greater than 10 can be represented as letters if required"""
-        sudoku_key: dict[str: int] = {key: value for key, value in zip("123456789abcdefg", range(1, 17))}
-        if converted := sudoku_key.get(value, False):
-            return converted
-        elif converted := {item: key for key, item in sudoku_key.items()}.get(value, False):
-            return converted
+        if isinstance(value, str) and len(value) == 1 and value in _SYMBOLS:
+            return _SYMBOLS.index(value) + 1
+        elif isinstance(value, int) and 0 < value <= len(_SYMBOLS):
+            return _SYMBOLS[value - 1]
         else:
             raise ValueError("Invalid argument value for tr function, expected a"
-                             f" int from 1 to 16 or a str from a to g, got {value} instead.")
+                             f" int from 1 to {len(_SYMBOLS)} or a str from {_SYMBOLS[0]} to {_SYMBOLS[-1]}, "
+                             f"got {value} instead.")
 
     def initial_numbers(self, row_col: bool = True) -> tuple:
         """ class Sudoku initial numbers public method: once a sudoku is validated (read public method) it returns
@@ -307,42 +737,23 @@ class Sudoku:
     def __error_color(self, *args: str) -> str:
         """ private method error_color allows the display of input errors (repetitions inside a row, col or quadrant)
             with a color user aid to a command line interface"""
-        red_values = tuple((int(self.tr(item[0])) - 1) * self.size + int(self.tr(item[1])) for item in args)
-        head: str = (f"{' ' * (len(str(self.size)) + 3)}"
-                     f"{''.join(tuple(f' col{val}' for val in range(1, self.size + 1)))}\n")
-        color_row = []
-        for position in range(1, self.size ** 2 + 1):
-            row = position // self.size if position % self.size == 0 else position // self.size + 1
-            col = self.size if position % self.size == 0 else position % self.size
-            row_col = self.sudoku.at[f"row{row}", f"col{col}"]
-            if position in red_values:
-                color_row.append(f"{' ' * (3 + len(str(col)) - len(str(row_col)))}"
-                                 f"{Fore.RED}{row_col}{Style.RESET_ALL} ")
-            else:
-                color_row.append(f"{' ' * (3 + len(str(col)) - len(str(row_col)))}{row_col} ")
-            if position % self.size == 0:
-                row_table: str = f"row{row}{' ' * (3 - len(str(row)))}" if self.size > 9 else f"row{row} "
-                row_table += "".join(color_row)
-                head += row_table.strip()
-                if position != self.size**2:
-                    head += "\n"
-                color_row.clear()
-        return head
-
-    def _with_letters(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        """ private method with_letters change the sudoku cells grater than 9 to letters if the user
-            has that option selected"""
-        new_dataframe = dataframe.applymap(func=lambda x: self.tr(x) if x in tuple(range(10, self.size + 1)) else x)
-        return new_dataframe
+        from render import Board, RED
+        return str(Board(self.size, (self._shown(value) for value in self.grid),
+                         {(int(self.tr(item[0])) - 1) * self.size + int(self.tr(item[1])) - 1: RED for item in args}))
 
-    @staticmethod
-    def _filtro(child_location: str, current_location: str) -> bool:
-        """ static private method filtro helps to find all the cells which possibilities are changed
-            when a kin cell is also changed"""
-        for index, num in enumerate(current_location):
-            if num == child_location[index]:
-                return True
-        return False
+    def _shown(self, value: int) -> int | str:
+        """ private method shown returns how a value of the grid is displayed, - for empty cells and letters for
+            the values grater than 9 if the user has that option selected"""
+        if not value:
+            return "-"
+        return self.tr(value) if self.letters and self.size > 9 and value > 9 else value
+
+    def _to_frame(self, values: array) -> "pd.DataFrame":
+        """ private method to_frame builds the dataframe of a game from the flat array of its values"""
+        return _pandas().DataFrame([[self._shown(value) for value in values[row * self.size:(row + 1) * self.size]]
+                             for row in range(self.size)],
+                            index=[f"row{row}" for row in range(1, self.size + 1)],
+                            columns=[f"col{col}" for col in range(1, self.size + 1)], dtype=object)
 
     def __str__(self) -> str:
         if self.sudoku is not None:
@@ -355,43 +766,526 @@ class Sudoku:
         return len(self.initial_values)
 
 
+class _Layouts(dict):
+    """ class _Layouts is a dict that builds the cell tables of a sudoku size the first time they are asked for"""
+
+    def __missing__(self, size: int) -> Layout:
+        self[size] = Layout(size)
+        return self[size]
+
+
+# cell tables of every sudoku size, built once the first time a size is used
+LAYOUTS: dict[int: Layout] = _Layouts()
+# symbol of every value in a sudoku string, the largest size with a symbol for every value and
+# the minimum number of initial values of the sizes where it is known, at the time of the writing
+# of this program no sudoku with less initial values has a unique solution
+_SYMBOLS: str = "123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_MAX_SIZE: int = isqrt(len(_SYMBOLS)) ** 2
+_MIN_GIVENS: dict[int: int] = {4: 4, 9: 17, 16: 55}
+# format of a cell of a game read from a dataframe, the same the rows of the txt file are checked for
+_CELL_FORMAT: re.Pattern = re.compile(r"^([1-9][0-9]?|[a-zA-Z]|-)$")
+# max_level of the sizes where it was measured, used to rate the difficulty of a sudoku from 1 to 100
+_MAX_LEVELS: dict[int: int] = {4: 30, 9: 5_000, 16: 1_400_000}
+
+
+@functools.cache
+def _pandas():
+    """ function _pandas imports pandas the first time a dataframe is needed and sets its display options
+    once so the dataframes of every size up to the largest one are shown whole in console or as a string"""
+    import pandas
+    pandas.set_option("display.max_columns", max(_MAX_SIZE, pandas.get_option("display.max_columns") or 0))
+    pandas.set_option("display.max_rows", max(_MAX_SIZE, pandas.get_option("display.max_rows") or 0))
+    pandas.set_option("display.width", max(7 * _MAX_SIZE, pandas.get_option("display.width") or 0))
+    return pandas
+
+
+def _min_givens(size: int) -> int:
+    """ function _min_givens returns the minimum number of initial values a sudoku of the given size needs,
+    for sizes without a known minimum it is size - 1 since with two values missing from the whole game
+    they could be swapped and the sudoku would have two solutions"""
+    return _MIN_GIVENS.get(size, size - 1)
+
+
+def _parse_game(game: str) -> tuple[int, list[tuple[int, int]]]:
+    """ function _parse_game reads a sudoku string, either one symbol per cell with - for empty cells or
+    the rows split by | with a (column, value) pair of symbols for every initial value, and returns the
+    sudoku size and its initial values as (cell, value) pairs, an InputError is raised for invalid strings"""
+    if "|" in game:
+        rows: list[str] = game.split("|")
+        size: int = len(rows)
+        symbols: str = _SYMBOLS[:size]
+        if Sudoku.valid_size(size) and all(len(row) % 2 == 0 and len(row) <= 2 * size for row in rows) \
+                and all(symbol in symbols for row in rows for symbol in row):
+            return size, [(count * size + symbols.index(row[val]), symbols.index(row[val + 1]) + 1)
+                          for count, row in enumerate(rows) for val in range(0, len(row), 2)]
+    else:
+        size: int = isqrt(len(game))
+        symbols: str = _SYMBOLS[:size]
+        if size ** 2 == len(game) and Sudoku.valid_size(size) and all(symbol in symbols or symbol == "-"
+                                                                         for symbol in game):
+            return size, [(cell, symbols.index(symbol) + 1) for cell, symbol in enumerate(game) if symbol != "-"]
+    raise InputError("Invalid value for class Sudoku size argument, "
+                     f"\nexpected a valid sudoku string your value: {game}.")
+
+
+def _subsets(items: list[tuple[int, int]], size: int, start: int = 0,
+             chosen: tuple = (), union: int = 0):
+    """ function _subsets is a generator that yields every group of size items (key, mask) whose masks
+    joined have exactly size bits set, as a tuple with the keys of the group and the joined mask"""
+    if len(chosen) == size:
+        if union.bit_count() == size:
+            yield chosen, union
+        return
+    for index in range(start, len(items)):
+        key, mask = items[index]
+        joined: int = union | mask
+        if joined.bit_count() <= size:
+            yield from _subsets(items, size, index + 1, chosen + (key,), joined)
+
+
+def _remove_mask(game: Candidates, cell: int, mask: int) -> int:
+    """ function _remove_mask removes every value inside mask from the possibilities of a cell and
+    returns how many were removed"""
+    removed: int = 0
+    for value in game.options(game.masks[cell] & mask):
+        if not game.remove(cell, value):
+            return removed + 1
+        removed += 1
+    return removed
+
+
+def _naked_subsets(game: Candidates) -> int:
+    """ function _naked_subsets finds groups of n cells inside a unit that between them only have n possible
+    values (naked pairs, triples and quads) and removes those values from the other cells of the unit"""
+    removed: int = 0
+    masks: list[int] = game.masks
+    for unit in game.layout.units:
+        open_cells: list[int] = [cell for cell in unit if masks[cell]]
+        # a naked group of n cells leaves a hidden group of the other cells so half the unit is enough
+        for size in range(2, min(4, len(open_cells) // 2) + 1):
+            items: list[tuple[int, int]] = [(cell, masks[cell]) for cell in open_cells
+                                            if masks[cell].bit_count() <= size]
+            for group, union in _subsets(items, size):
+                for cell in open_cells:
+                    if cell not in group and masks[cell] & union:
+                        removed += _remove_mask(game, cell, union)
+                        if game.dead:
+                            return removed
+    return removed
+
+
+def _hidden_subsets(game: Candidates) -> int:
+    """ function _hidden_subsets finds groups of n values that inside a unit can only go in the same n cells
+    (hidden pairs, triples and quads) and removes any other possibility from those cells"""
+    removed: int = 0
+    masks: list[int] = game.masks
+    for number, unit in enumerate(game.layout.units):
+        open_cells: int = sum(1 for cell in unit if masks[cell])
+        # positions inside the unit where each value not placed yet can go
+        places: list[tuple[int, int]] = [(value, game.places[number * game.size + value - 1])
+                                         for value in range(1, game.size + 1)
+                                         if game.places[number * game.size + value - 1]]
+        for size in range(2, min(4, open_cells // 2) + 1):
+            items: list[tuple[int, int]] = [item for item in places if item[1].bit_count() <= size]
+            for group, union in _subsets(items, size):
+                keep: int = 0
+                for value in group:
+                    keep |= 1 << (value - 1)
+                for index in game.options(union):
+                    cell: int = unit[index - 1]
+                    if masks[cell] & ~keep:
+                        removed += _remove_mask(game, cell, ~keep)
+                        if game.dead:
+                            return removed
+    return removed
+
+
+def _pointing(game: Candidates) -> int:
+    """ function _pointing finds values that inside a quadrant can only go in one row or column
+    (pointing pairs and triples) and removes them from the rest of that row or column"""
+    removed: int = 0
+    layout: Layout = game.layout
+    masks: list[int] = game.masks
+    for number, quadrant in enumerate(layout.quadrants, start=2 * game.size):
+        for value in range(1, game.size + 1):
+            bit: int = 1 << (value - 1)
+            found: int = game.places[number * game.size + value - 1]
+            if not found & (found - 1):
+                continue
+            cells: list[int] = [quadrant[index - 1] for index in game.options(found)]
+            for line in (layout.rows[cells[0] // game.size], layout.cols[cells[0] % game.size]):
+                if all(cell in line for cell in cells):
+                    for cell in line:
+                        if cell not in quadrant and masks[cell] & bit:
+                            removed += 1
+                            if not game.remove(cell, value):
+                                return removed
+    return removed
+
+
+def _box_line(game: Candidates) -> int:
+    """ function _box_line finds values that inside a row or column can only go in one quadrant
+    (box line reduction) and removes them from the rest of that quadrant"""
+    removed: int = 0
+    layout: Layout = game.layout
+    masks: list[int] = game.masks
+    for number, line in enumerate(layout.rows + layout.cols):
+        for value in range(1, game.size + 1):
+            bit: int = 1 << (value - 1)
+            found: int = game.places[number * game.size + value - 1]
+            if not found & (found - 1):
+                continue
+            cells: list[int] = [line[index - 1] for index in game.options(found)]
+            quadrant: tuple[int] = layout.cell_units[cells[0]][2]
+            if all(cell in quadrant for cell in cells):
+                for cell in quadrant:
+                    if cell not in line and masks[cell] & bit:
+                        removed += 1
+                        if not game.remove(cell, value):
+                            return removed
+    return removed
+
+
+def _fish(game: Candidates, size: int) -> int:
+    """ function _fish finds n rows (or columns) where a value can only go in the same n columns (or rows),
+    then the value can't go anywhere else in those columns (X-Wing for 2, Swordfish for 3, Jellyfish for 4)"""
+    removed: int = 0
+    layout: Layout = game.layout
+    masks: list[int] = game.masks
+    for value in range(1, game.size + 1):
+        bit: int = 1 << (value - 1)
+        for first, cover, base_of in ((0, layout.cols, lambda cell: cell // game.size),
+                                      (game.size, layout.rows, lambda cell: cell % game.size)):
+            # the places of a value in a row are its columns and the places in a column are its rows
+            items: list[tuple[int, int]] = []
+            for index in range(game.size):
+                found: int = game.places[(first + index) * game.size + value - 1]
+                if 2 <= found.bit_count() <= size:
+                    items.append((index, found))
+            for group, union in _subsets(items, size):
+                for place in game.options(union):
+                    for cell in cover[place - 1]:
+                        if masks[cell] & bit and base_of(cell) not in group:
+                            removed += 1
+                            if not game.remove(cell, value):
+                                return removed
+    return removed
+
+
+def _x_wing(game: Candidates) -> int:
+    """ function _x_wing runs the fish strategy over pairs of rows or columns"""
+    return _fish(game, 2)
+
+
+def _swordfish(game: Candidates) -> int:
+    """ function _swordfish runs the fish strategy over groups of three rows or columns"""
+    return _fish(game, 3)
+
+
+def _jellyfish(game: Candidates) -> int:
+    """ function _jellyfish runs the fish strategy over groups of four rows or columns"""
+    return _fish(game, 4)
+
+
+def _xy_wing(game: Candidates) -> int:
+    """ function _xy_wing finds a cell with two possible values xy that sees two other cells with possible
+    values xz and yz, whatever the first cell ends up being one of the others is z so z is removed
+    from every cell seeing both of them"""
+    removed: int = 0
+    layout: Layout = game.layout
+    masks: list[int] = game.masks
+    for pivot in range(game.size ** 2):
+        pivot_mask: int = masks[pivot]
+        if pivot_mask.bit_count() != 2:
+            continue
+        wings: list[int] = [cell for cell in layout.peers[pivot]
+                            if masks[cell].bit_count() == 2 and (masks[cell] & pivot_mask).bit_count() == 1]
+        for index, first in enumerate(wings):
+            for second in wings[index + 1:]:
+                if masks[first] & pivot_mask == masks[second] & pivot_mask:
+                    continue
+                shared: int = masks[first] & ~pivot_mask
+                if shared != masks[second] & ~pivot_mask:
+                    continue
+                for cell in layout.peer_sets[first] & layout.peer_sets[second]:
+                    if cell != pivot and masks[cell] & shared:
+                        removed += 1
+                        if not game.remove(cell, shared.bit_length()):
+                            return removed
+    return removed
+
+
+def _xyz_wing(game: Candidates) -> int:
+    """ function _xyz_wing finds a cell with three possible values xyz that sees two cells with possible
+    values xz and yz, one of the three cells is z so z is removed from every cell seeing all of them"""
+    removed: int = 0
+    layout: Layout = game.layout
+    masks: list[int] = game.masks
+    for pivot in range(game.size ** 2):
+        pivot_mask: int = masks[pivot]
+        if pivot_mask.bit_count() != 3:
+            continue
+        wings: list[int] = [cell for cell in layout.peers[pivot]
+                            if masks[cell].bit_count() == 2 and not masks[cell] & ~pivot_mask]
+        for index, first in enumerate(wings):
+            for second in wings[index + 1:]:
+                if masks[first] | masks[second] != pivot_mask:
+                    continue
+                shared: int = masks[first] & masks[second]
+                for cell in layout.peer_sets[pivot] & layout.peer_sets[first] & layout.peer_sets[second]:
+                    if masks[cell] & shared:
+                        removed += 1
+                        if not game.remove(cell, shared.bit_length()):
+                            return removed
+    return removed
+
+
+# human solving techniques that can be used by a Solution object, in the order they are tried by default,
+# each one takes a Candidates object and returns how many possibilities it removed
+STRATEGIES: dict[str: callable] = {
+    "pointing": _pointing,
+    "box_line": _box_line,
+    "naked_subsets": _naked_subsets,
+    "hidden_subsets": _hidden_subsets,
+    "x_wing": _x_wing,
+    "xy_wing": _xy_wing,
+    "xyz_wing": _xyz_wing,
+    "swordfish": _swordfish,
+    "jellyfish": _jellyfish,
+}
+
+
+class SolveStats:
+    """ class SolveStats collects how a Solution object solved its last sudoku when it is set as its stats
+    property: the values played (propagations, guesses included), the possibilities removed (eliminations),
+    the candidate states copied into search nodes (snapshots), the nodes of the breadth first search whose
+    game (zobrist key) another node reached before (transpositions), the nodes of every generation of the
+    breadth first search (generations), the biggest frontier or deepest guess stack of the depth first search
+    (peak_frontier) and the seconds spent in each phase of the search (timers), the time of a phase includes
+    the phases it calls, so the put_values time is part of the possibility_compare time too. The keys of
+    the nodes are only found while the stats are on and at most MAX_KEYS of them are kept to look for
+    transpositions"""
+
+    MAX_KEYS: int = 65_536
+    PHASES: tuple[str] = ("search", "put_values", "possibility_compare", "is_valid_game", "strategies")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """ method reset sets every counter and timer back to 0"""
+        self.propagations: int = 0
+        self.eliminations: int = 0
+        self.snapshots: int = 0
+        self.transpositions: int = 0
+        self.keys: set[int] = set()
+        self.generations: list[int] = []
+        self.peak_frontier: int = 0
+        self.timers: dict[str: float] = {phase: 0.0 for phase in self.PHASES}
+
+    def timed(self, phase: str, function: callable, *args, **kwargs):
+        """ method timed calls function with the given arguments adding the time it takes to the timer of
+        phase and returns what function returns"""
+        start: float = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.timers[phase] += time.perf_counter() - start
+
+    def generation(self, nodes: list["SearchNode"], layout: Layout) -> None:
+        """ method generation records a new generation of the breadth first search of a sudoku with the given
+        layout, every node keeps a copy of the candidate state and the ones with the key of a node seen
+        before are counted as transpositions"""
+        self.generations.append(len(nodes))
+        self.snapshots += len(nodes)
+        self.peak_frontier = max(self.peak_frontier, len(nodes))
+        for node in nodes:
+            key: int = layout.key(node.values)
+            if key in self.keys:
+                self.transpositions += 1
+            elif len(self.keys) < self.MAX_KEYS:
+                self.keys.add(key)
+
+    def merge(self, other: "SolveStats") -> None:
+        """ method merge adds the counters and timers of other, the stats of a worker process shard"""
+        self.propagations += other.propagations
+        self.eliminations += other.eliminations
+        self.snapshots += other.snapshots
+        self.transpositions += other.transpositions
+        for phase, seconds in other.timers.items():
+            self.timers[phase] += seconds
+
+    def as_dict(self) -> dict:
+        """ method as_dict returns the counters and timers as a dict"""
+        return {
+            "propagations": self.propagations,
+            "eliminations": self.eliminations,
+            "snapshots": self.snapshots,
+            "transpositions": self.transpositions,
+            "generations": list(self.generations),
+            "peak_frontier": self.peak_frontier,
+            "timers": dict(self.timers)
+        }
+
+
+def _timed(phase: str) -> callable:
+    """ function _timed decorates a Solution method so its time is added to the phase timer of the stats
+    property, when stats is None the method is called as it is"""
+    def decorator(method: callable) -> callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.stats is None:
+                return method(self, *args, **kwargs)
+            return self.stats.timed(phase, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class Solution(Sudoku):
     """class solution it's a child of the Sudoku class and the one in charge
     of finding the sudoku solution"""
 
-    def __init__(self, size: int | str | pd.DataFrame = 9, letter: bool = False,
+    def __init__(self, size: "int | str | pd.DataFrame" = 9, letter: bool = False,
                  color: bool = False):
         super().__init__(size, letter, color)
         self.alt_unknowns: list[tuple] = []
-        self.solution_path: list[str] = []
+        self.solved_node: SearchNode | None = None
+        self.solved_grid: array | None = None
         self.puzzle: None | pd.DataFrame = None
         self.time: None | float = None
         self.iterations: int = 1
         self.max_time: int | float = 10
-        self.max_level: int = 30 if self.size == 4 else (5_000 if self.size == 9 else 1_400_000)
+        # sizes past 16 by 16 scale the 16 by 16 level by the growth seen from 9 by 9 to 16 by 16
+        self.max_level: int = _MAX_LEVELS.get(self.size, round(_MAX_LEVELS[16] * (self.size / 16) ** 10))
+        self.engine: str = "propagation"
+        self.workers: int = 1
+        self.search: str = "breadth"
+        self.max_work: int | None = None
+        self.work: int = 0
+        self.cancel_event: threading.Event = threading.Event()
+        self.__deadline: float = float("inf")
+        self.__next_check: int = 256
+        # work of a worker process shard already added to the shared work of the parallel search
+        self.__shared_work: int = 0
+        self.strategies: tuple[str] = tuple(STRATEGIES)
+        self.strategy_hits: dict[str: int] = {name: 0 for name in STRATEGIES}
+        self.stats: SolveStats | None = None
+        self.cache = None
 
-    def solve(self) -> pd.DataFrame:
+    def solve(self) -> "pd.DataFrame":
         """ public method solve is in charge of taking the current sudoku and search a solution if
             there is any, this function may halt if the sudoku it's difficult enough to take more time
             than the current set max time, or if the sudoku is invalid (seemingly valid sudokus detected
             as such by this program may still be invalid and as such they will raise and error)
-            if a solution is found a dataframe containing the solved sudoku is returned"""
-        if self.sudoku is not None:
-            if self.verified:
-                self.puzzle = copy.deepcopy(self.sudoku)
-            else:
-                self.puzzle = copy.deepcopy(self.read())
-        else:
+            if a solution is found a dataframe containing the solved sudoku is returned, the search is done
+            by the engine set in the engine property"""
+        if self.grid is None and self.sudoku is None:
             raise SudokuError("Can't call solve method of class Solution before entering a valid sudoku game")
+        if not self.verified:
+            self._load()
+        self.solved_grid = array("B", self.grid)
+        self.puzzle = None
         start_time: float = time.process_time()
-        self.__put_values(self.unknown_values, method=0)
+        self.__search()
+        return self.__finish(start_time)
+
+    def count_solutions(self, limit: int = 2) -> int:
+        """ public method count_solutions counts the solutions of the current sudoku stopping as soon as limit
+            solutions are found, so count_solutions(2) tells apart sudokus with none, one or many solutions
+            without searching for all of them, the count is done by the dancing links engine after playing
+            every value that follows from the initial ones and it's bound by the max time and max work limits"""
+        if self.grid is None and self.sudoku is None:
+            raise SudokuError("Can't call count_solutions method of class Solution before entering a valid sudoku game")
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise InputError(f"Expected an int greater than 0 got {limit} instead.")
+        if not self.verified:
+            self._load()
+        cells: dict[str: int] = {key: cell for cell, key in enumerate(LAYOUTS[self.size].keys)}
+        game_dict: Candidates = Candidates(self.size)
+        for key, value in self.initial_values.items():
+            game_dict.place(cells[key], value[0])
+        self.__start_limits()
+        if game_dict.dead or not self.__propagate(game_dict):
+            return 0
+        if self.__end(game_dict):
+            return 1
+        return sum(1 for _ in islice(DancingLinks(game_dict).search(self.__check_limits), limit))
+
+    def is_unique(self) -> bool:
+        """ public method is_unique returns True if the current sudoku has one and only one solution"""
+        return self.count_solutions(limit=2) == 1
+
+    def _solve_givens(self, givens: list[tuple[int, int]]) -> str:
+        """ method _solve_givens solves the game made of the given (cell, value) pairs without building
+            or reading any dataframe and returns the solved game as a string, it is the one used by
+            solve_many so a single object can solve many games of its size one after the other"""
+        self.initial_values = {LAYOUTS[self.size].keys[cell]: [value] for cell, value in givens}
+        self.unknown_values = Candidates(self.size)
+        self.alt_unknowns = []
+        self.solved_node = None
+        self.iterations = 1
+        self.strategy_hits = {name: 0 for name in STRATEGIES}
+        self.time = None
+        self.sudoku = None
+        self.grid = array("B", bytes(self.size ** 2))
+        self.solved_grid = None
+        self.puzzle = None
+        for cell, value in givens:
+            self.grid[cell] = value
+            self.unknown_values.place(cell, value)
+        start_time: float = time.process_time()
+        self.__search()
+        self.time = time.process_time() - start_time
+        self.solved_grid = array("B", self.unknown_values.values)
+        return "".join(_SYMBOLS[value - 1] for value in self.solved_grid)
+
+    def __search(self) -> None:
+        """ private method search looks for a solution of the game in unknown_values with the engine set in
+            the engine property and leaves the solved game in it, an InputError is raised if there is no
+            solution and a time SudokuError if a limit is reached first, the stats (if any) are reset first and
+            if there is a cache its solution is used when it has one for the game (or a copy of it)"""
+        if self.stats is not None:
+            self.stats.reset()
+        # the limits also bound the time spent finding the canonical form of the game for the cache
+        self.__start_limits()
+        if self.cache is not None:
+            givens: list[int] = self.unknown_values.values[:]
+            found, key = self.cache.lookup(self.size, givens, self.__check_limits)
+            if self.__cached(found):
+                return
+        if self.stats is None:
+            self.__explore()
+        else:
+            self.stats.timed("search", self.__measured, self.__explore)
+        if self.cache is not None and key is not None:
+            self.cache.store(self.size, givens, self.unknown_values.values, self.iterations, key)
+
+    def __cached(self, found: tuple[list[int], int] | None) -> bool:
+        """ private method cached plays the solution found by the cache for the game (as values and iterations)
+            and returns True, it returns False and leaves the game as it was if there is none"""
+        if found is None:
+            return False
+        mark: int = self.unknown_values.checkpoint()
+        if all(self.unknown_values.place(cell, value) for cell, value in enumerate(found[0])) \
+                and self.__end(self.unknown_values):
+            self.iterations = found[1]
+            return True
+        self.unknown_values.rollback(mark)
+        return False
+
+    def __explore(self) -> None:
+        """ private method explore does the search of the search private method"""
+        if self.unknown_values.dead or not self.__propagate(self.unknown_values, method=0):
+            raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
+                             "\nbut the sudoku seems to be not.")
+        # the guesses made from here on are rolled back to this point
+        self.unknown_values.trail.clear()
         if self.__end(self.unknown_values):
-            end_time: float = time.process_time()
-            self.time = end_time - start_time
-            if self.letters and self.size > 9:
-                self.puzzle: pd.DataFrame = self._with_letters(self.puzzle)
-            return self.puzzle
-        min_value: int = min(tuple(len(options) for options in self.unknown_values.values() if len(options) > 0))
+            return
+        if self.engine == "dlx":
+            self.__link_values(self.unknown_values)
+            return
+        min_value: int = min(tuple(mask.bit_count() for mask in self.unknown_values.masks if mask))
         for possible_value in range(min_value - 1, min_value + self.size//2):
             if possible_value == min_value - 1:
                 is_solved: bool = self.__possibility_compare(self.unknown_values, possible_value,
@@ -399,58 +1293,91 @@ class Solution(Sudoku):
             else:
                 is_solved: bool = self.__possibility_compare(self.unknown_values, possible_value, is_alt=False)
             if is_solved and self.__end(self.unknown_values):
-                end_time: float = time.process_time()
-                self.time: float = end_time - start_time
-                if self.letters and self.size > 9:
-                    self.puzzle: pd.DataFrame = self._with_letters(self.puzzle)
-                return self.puzzle
-        new_node = tuple(self.__next_node(item) for item in self.alt_unknowns)
+                return
+        if self.search == "depth":
+            self.__depth_search(self.alt_unknowns[0][0] if self.alt_unknowns else 0,
+                                tuple(value for _, value in self.alt_unknowns))
+            return
+        root = SearchNode(self.unknown_values, self.alt_unknowns[0][0] if self.alt_unknowns else 0,
+                          tuple(value for _, value in self.alt_unknowns))
+        if self.stats is not None:
+            self.stats.generation([root], LAYOUTS[self.size])
+        new_node = (self.__next_node(root),)
         if "solved" in new_node:
-            if self.__testing():
-                end_time: float = time.process_time()
-                self.time = end_time - start_time
-                if self.letters and self.size > 9:
-                    self.puzzle = self._with_letters(self.puzzle)
-                return self.puzzle
+            return
         new_node = tuple(item for item in new_node if isinstance(item, tuple))
         if not new_node:
             raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
                              "\nbut the sudoku seems to be not.")
-        running_time: float = time.time() + 60 * self.max_time
-        while True:
-            new_node = tuple(self.__next_node(val) for item in new_node for val in item)
-            if "solved" in new_node:
+        pool: ProcessPoolExecutor | None = None
+        stop = work = None
+        try:
+            while True:
+                nodes: list[SearchNode] = [val for item in new_node for val in item]
+                if self.stats is not None:
+                    self.stats.generation(nodes, LAYOUTS[self.size])
+                if self.workers > 1 and len(nodes) >= 4 * self.workers:
+                    if pool is None:
+                        # shards past the first solved one read stop to end early and every shard adds its
+                        # work to work so the work limit holds for the whole search
+                        import multiprocessing
+                        from concurrent.futures import ProcessPoolExecutor
+                        stop = multiprocessing.Value("q", 0)
+                        work = multiprocessing.Value("q", 0)
+                        pool = ProcessPoolExecutor(self.workers, initializer=_start_worker, initargs=(stop, work))
+                    new_node = self.__expand_parallel(nodes, pool, stop, work)
+                else:
+                    new_node = tuple(self.__next_node(val) for val in nodes)
+                if "solved" in new_node:
+                    break
+                new_node = tuple(item for item in new_node if isinstance(item, tuple))
+                if not new_node:
+                    raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
+                                     "\nbut the sudoku seems to be not.")
+                self.__check_limits()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _expand_shard(self, start: int, nodes: list[SearchNode], deadline: float = float("inf"),
+                      max_work: int | None = None) -> tuple | None:
+        """ method _expand_shard expands the nodes of a shard of the search frontier inside a worker
+            process, it returns the result of each node up to the first solved one, the iterations, strategy
+            hits, work and stats (or None) counted while doing it and the solved node (or None), if a shard
+            before this one already found a solution it stops and returns None. The deadline and max work
+            of the whole search are checked as the nodes are expanded, along with the cancellation of the
+            search, so a time SudokuError is raised in the middle of the shard once one is reached"""
+        self.iterations = 0
+        self.work = 0
+        self.max_work = max_work
+        self.__deadline = deadline
+        self.__shared_work = 0
+        self.__next_check = 0
+        self.strategy_hits = {name: 0 for name in STRATEGIES}
+        self.solved_node = None
+        results: list = []
+        if self.stats is not None:
+            self.stats.reset()
+        for node in nodes:
+            if _STOP is not None and _STOP.value < start:
+                return None
+            results.append(self.__next_node(node) if self.stats is None
+                           else self.__measured(self.__next_node, node))
+            if self.solved_node is not None:
                 break
-            new_node = tuple(item for item in new_node if isinstance(item, tuple))
-            if not new_node:
-                raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
-                                 "\nbut the sudoku seems to be not.")
-            elif time.time() > running_time:
-                raise SudokuError("the program is taking more time to solve the sudoku "
-                                  f"\nthan the current time limit: {self.max_time} minutes.\n"
-                                  f"game string representation:\n"
-                                  f"{self.stringify()['start'] if self.sudoku is not None else 'not available'}",
-                                  time_error=True)
-        if self.__testing():
-            end_time: float = time.process_time()
-            self.time = end_time - start_time
-            if self.letters and self.size > 9:
-                self.puzzle: pd.DataFrame = self._with_letters(self.puzzle)
-            return self.puzzle
-        else:
-            raise SudokuError("unable to found a valid solution for your sudoku.")
+        return tuple(results), self.iterations, self.strategy_hits, self.solved_node, self.work, self.stats
 
     def found_values(self, row_col: bool = True) -> tuple:
         """ public method found_values returns the found values by the solve method and returns them as a dict
             containing the row, col and value of each or a tuple containing the position (1-16, 1-81 or 1-256 depending
             on the current sudoku size) and the value"""
         found: list = []
-        initials = tuple(val[0] for val in self.initial_numbers(row_col=False))
+        initials = {val[0] for val in self.initial_numbers(row_col=False)}
         for position in range(1, self.size**2 + 1):
             if position not in initials:
                 row: int = position // self.size if position % self.size == 0 else position // self.size + 1
                 col: int = self.size if position % self.size == 0 else position % self.size
-                value: int = self.puzzle.at[f"row{row}", f"col{col}"]
+                value: int | str = self._shown(self.solved_grid[position - 1])
                 if row_col:
                     found.append({"row": row, "col": col, "value": value})
                 else:
@@ -459,29 +1386,36 @@ class Solution(Sudoku):
 
     def extra_info(self, raw_level: bool = False) -> dict:
         """ public method extra_info returns as a dict the number of initials values (start_vals key),
-            the solving time (solving_time key) and the relative difficulty (difficulty key) of the sudoku"""
+            the solving time (solving_time key) and the relative difficulty (difficulty key) of the sudoku,
+            if the stats property is set the dict of its counters and timers is added too (stats key)"""
         if not raw_level:
             level: float = (self.iterations if self.max_level == 0
                             else self.iterations / self.max_level) * 100
-            return {
+            info: dict = {
                 "start_vals": self.__len__(),
                 "solving_time": "0" if self.time is None else f"{self.time:.3f} seconds",
                 "difficulty": f"{100 if level >= 100 else (1 if level <= 1 else int(level))}/100"
             }
         else:
-            return {
+            info: dict = {
                 "start_vals": self.__len__(),
                 "solving_time": "0" if self.time is None else f"{self.time:.3f} seconds",
                 "difficulty": self.iterations
             }
+        if self.stats is not None:
+            info["stats"] = self.stats.as_dict()
+        return info
 
     def stringify(self) -> dict:
         """ public method stringify return as a dict a string representation of the current sudoku, one
             containing the unsolved state of the sudoku (start key) and other with the solved state (end key)"""
         strings_: dict[str, str | None] = {}
-        if self.sudoku is not None:
-            rows_values = tuple("".join(tuple(self.tr(val) if isinstance(val, int) else val
-                                              for val in self.sudoku.iloc[row])) for row in range(0, self.size))
+        if self.grid is None and self.sudoku is not None:
+            self._load()
+        if self.grid is not None:
+            rows_values = tuple("".join(tuple(self.tr(val) if val else "-"
+                                              for val in self.grid[row * self.size:(row + 1) * self.size]))
+                                for row in range(0, self.size))
             if len(self.initial_values) * 2 + self.size - 1 < self.size**2:
                 sudoku_strings = []
                 for row in rows_values:
@@ -497,14 +1431,23 @@ class Solution(Sudoku):
         else:
             strings_["start"] = None
             # always like this 2-1----3-----2--
-        if self.puzzle is not None:
-            rows_values = tuple("".join(tuple(self.tr(val) if isinstance(val, int) else val
-                                              for val in self.puzzle.iloc[row])) for row in range(0, self.size))
-            strings_["end"] = "".join(rows_values)
+        if self.solved_grid is not None:
+            strings_["end"] = "".join(self.tr(val) if val else "-" for val in self.solved_grid)
         else:
             strings_["end"] = None
         return strings_
 
+    @property
+    def puzzle(self) -> "pd.DataFrame | None":
+        if self._puzzle is None and self.solved_grid is not None:
+            self._puzzle = self._to_frame(self.solved_grid)
+        return self._puzzle
+
+    @puzzle.setter
+    def puzzle(self, value: "pd.DataFrame | None") -> None:
+        # the solved dataframe is built again from the solved grid the next time it's asked for
+        self._puzzle = value
+
     @property
     def max_time(self) -> int:
         return self._max_time
@@ -516,6 +1459,99 @@ class Solution(Sudoku):
         else:
             raise InputError(f"Expected an int or float between 1 and 30 got {new_val} instead.")
 
+    @property
+    def solution_path(self) -> list[str]:
+        """ the moves of the branch that solved the sudoku as a list with one string like '5 a3f+7 b21'
+            (value and cell key joined by +) or an empty list if no branch was needed or the game is unsolved"""
+        if self.solved_node is None:
+            return []
+        return ["+".join(f"{value} {LAYOUTS[self.size].keys[cell]}" for value, cell in self.solved_node.path())]
+
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+    @engine.setter
+    def engine(self, new_val: str) -> None:
+        if new_val in ("propagation", "dlx"):
+            self._engine = new_val
+        else:
+            raise InputError(f"Expected engine propagation or dlx got {new_val} instead.")
+
+    @property
+    def max_work(self) -> int | None:
+        return self._max_work
+
+    @max_work.setter
+    def max_work(self, new_val: int | None) -> None:
+        if new_val is None or isinstance(new_val, int) and not isinstance(new_val, bool) and new_val > 0:
+            self._max_work = new_val
+        else:
+            raise InputError(f"Expected None or an int greater than 0 got {new_val} instead.")
+
+    def cancel(self) -> None:
+        """ public method cancel asks a running solve method to stop, it can be called from another thread
+            and solve raises a time SudokuError the next time it checks its limits, the request stays until
+            cancel_event gets cleared"""
+        self.cancel_event.set()
+
+    @property
+    def search(self) -> str:
+        return self._search
+
+    @search.setter
+    def search(self, new_val: str) -> None:
+        if new_val in ("breadth", "depth"):
+            self._search = new_val
+        else:
+            raise InputError(f"Expected search breadth or depth got {new_val} instead.")
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @workers.setter
+    def workers(self, new_val: int) -> None:
+        if isinstance(new_val, int) and not isinstance(new_val, bool) and new_val > 0:
+            self._workers = new_val
+        else:
+            raise InputError(f"Expected an int greater than 0 got {new_val} instead.")
+
+    @property
+    def strategies(self) -> tuple[str]:
+        return self._strategies
+
+    @strategies.setter
+    def strategies(self, new_val: tuple[str] | list[str]) -> None:
+        if isinstance(new_val, tuple | list) and all(name in STRATEGIES for name in new_val):
+            self._strategies = tuple(new_val)
+        else:
+            raise InputError(f"Expected a tuple or list with strategies from {', '.join(STRATEGIES)} "
+                             f"got {new_val} instead.")
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, new_val) -> None:
+        # a SolutionCache of the symmetry module or any object with its lookup and store methods
+        if new_val is None or callable(getattr(new_val, "lookup", None)) and callable(getattr(new_val, "store", None)):
+            self._cache = new_val
+        else:
+            raise InputError(f"Expected None or a SolutionCache object got {new_val} instead.")
+
+    @property
+    def stats(self) -> SolveStats | None:
+        return self._stats
+
+    @stats.setter
+    def stats(self, new_val: SolveStats | None) -> None:
+        if new_val is None or isinstance(new_val, SolveStats):
+            self._stats = new_val
+        else:
+            raise InputError(f"Expected None or a SolveStats object got {new_val} instead.")
+
     @property
     def max_level(self) -> int:
         return self._max_level
@@ -530,268 +1566,401 @@ class Solution(Sudoku):
     def __put_color(self) -> str:
         """ put_color private method displays the found values in color on a command line
         interfaces as a visual aid"""
-        head: str = (f"{' ' * (len(str(self.size)) + 3)}"
-                     f"{''.join(tuple(f' col{val}' for val in range(1, self.size + 1)))}\n")
-        color_row = []
-        white_values = tuple(val[0] for val in self.initial_numbers(row_col=False))
-        for position in range(1, self.size**2 + 1):
-            row = position // self.size if position % self.size == 0 else position // self.size + 1
-            col = self.size if position % self.size == 0 else position % self.size
-            row_col = self.puzzle.at[f"row{row}", f"col{col}"]
-            if position not in white_values:
-                color_row.append(f"{' ' * (3 + len(str(col)) - len(str(row_col)))}"
-                                 f"{Fore.GREEN}{row_col}{Style.RESET_ALL} ")
-            else:
-                color_row.append(f"{' ' * (3 + len(str(col)) - len(str(row_col)))}{row_col} ")
-            if position % self.size == 0:
-                row_table: str = f"row{row}{' ' * (3 - len(str(row)))}" if self.size > 9 else f"row{row} "
-                row_table += "".join(color_row)
-                head += row_table.strip()
-                if position != self.size**2:
-                    head += "\n"
-                color_row.clear()
-        return head
-
-    def __put_values(self, game_dict: dict, method: int, pick: int = 0, coord: str = "000 0") -> bool:
+        from render import Board, GREEN
+        return str(Board(self.size, (self._shown(value) for value in self.solved_grid),
+                         {cell: GREEN for cell, value in enumerate(self.grid) if not value}))
+
+    def __expand_parallel(self, nodes: list[SearchNode], pool: "ProcessPoolExecutor", stop, work) -> tuple:
+        """ private method expand_parallel splits a generation of the search frontier in shards expanded
+            by the worker processes of pool, the first solution in generation order wins so the found
+            solution, the next generation and the iterations are the same the serial search gets, the
+            shards share the limits of the search (stop is set to -1 to cancel them) and once one of them
+            reaches a limit the rest are stopped and a time SudokuError is raised"""
+        from concurrent.futures import wait, FIRST_COMPLETED
+        step: int = -(-len(nodes) // (4 * self.workers))
+        stop.value = len(nodes)
+        work.value = self.work
+        futures: dict = {pool.submit(_expand_shard, self.size, self.strategies, self.stats is not None, start,
+                                     nodes[start:start + step], self.__deadline, self.max_work): start
+                         for start in range(0, len(nodes), step)}
+        shards: dict[int: tuple | None] = {}
+        error: SudokuError | None = None
+        pending: set = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            if self.cancel_event.is_set():
+                stop.value = -1
+            for future in done:
+                start: int = futures[future]
+                try:
+                    shards[start] = future.result()
+                except SudokuError as shard_error:
+                    if not shard_error.time:
+                        raise
+                    error = error or shard_error
+                    stop.value = -1
+                    continue
+                if shards[start] is not None and shards[start][3] is not None:
+                    with stop.get_lock():
+                        stop.value = min(stop.value, start)
+        if stop.value < 0:
+            # the parent raises the error of the limit reached with its own game in the message
+            self.work = work.value
+            self.__check_limits()
+            raise error or self.__time_error("cancel")
+        new_node: list = []
+        for start in sorted(shards):
+            if start > stop.value:
+                break
+            results, iterations, hits, solved, shard_work, stats = shards[start]
+            self.iterations += iterations
+            self.work += shard_work
+            if stats is not None:
+                self.stats.merge(stats)
+            for name, count in hits.items():
+                self.strategy_hits[name] += count
+            for node, result in zip(nodes[start:], results):
+                if isinstance(result, tuple):
+                    for child in result:
+                        child.parent = node
+                node.release()
+                new_node.append(result)
+            if solved is not None:
+                solved.parent = nodes[start + len(results) - 1]
+                self.solved_node = solved
+                self.unknown_values.restore(solved)
+        return tuple(new_node)
+
+    def __measured(self, function: callable, *args):
+        """ private method measured calls function with the given arguments adding to the stats the values
+            played and the possibilities removed meanwhile in unknown_values and returns what function returns"""
+        placed, removed = self.unknown_values.placed, self.unknown_values.removed
+        try:
+            return function(*args)
+        finally:
+            self.stats.propagations += self.unknown_values.placed - placed
+            self.stats.eliminations += self.unknown_values.removed - removed
+
+    def __link_values(self, game_dict: Candidates) -> None:
+        """ private method link_values solves the cells left in game_dict with the dancing links
+            engine and writes the found values into the puzzle"""
+        links = DancingLinks(game_dict)
+        try:
+            found: tuple | None = next(links.search(self.__check_limits), None)
+        finally:
+            self.iterations += links.nodes
+        if found is None:
+            raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
+                             "\nbut the sudoku seems to be not.")
+        for cell, value in found:
+            self.__alter_child(game_dict, cell, value)
+
+    def __finish(self, start_time: float) -> "pd.DataFrame":
+        """ private method finish keeps the values of the solved game in the solved grid, saves the solving
+            time and returns the puzzle dataframe"""
+        self.solved_grid = array("B", self.unknown_values.values)
+        self.puzzle = None
+        end_time: float = time.process_time()
+        self.time = end_time - start_time
+        return self.puzzle
+
+    def __time_error(self, limit: str = "time") -> "SudokuError":
+        """ private method time_error builds the error raised when solving takes more than max time,
+            more work than max work or it gets cancelled through the cancel event"""
+        reasons: dict[str: str] = {
+            "time": f"the program is taking more time to solve the sudoku \nthan the current time limit: "
+                    f"{self.max_time} minutes.",
+            "work": f"the program is doing more work to solve the sudoku \nthan the current work limit: "
+                    f"{self.max_work} steps.",
+            "cancel": "the search for a solution of the sudoku was cancelled."
+        }
+        return SudokuError(f"{reasons[limit]}\ngame string representation:\n"
+                           f"{self.stringify()['start'] if self.grid is not None else 'not available'}",
+                           time_error=True)
+
+    def __start_limits(self) -> None:
+        """ private method start_limits resets the work done and sets the time limit before a search"""
+        self.work = 0
+        self.__deadline = time.time() + 60 * self.max_time
+        self.__next_check = 0
+
+    def __check_limits(self, work: int = 0) -> None:
+        """ private method check_limits adds work to the work done by the search and raises a time
+            SudokuError if the search was cancelled or went past the work or time limits, the hot loops
+            call it every 256 steps or when the work limit is reached"""
+        self.work += work
+        done: int = self.work
+        if _WORK is not None:
+            # a shard of the parallel search adds its work to the shared work of the whole search
+            with _WORK.get_lock():
+                _WORK.value += self.work - self.__shared_work
+                done = _WORK.value
+            self.__shared_work = self.work
+        if self.cancel_event.is_set() or _STOP is not None and _STOP.value < 0:
+            raise self.__time_error("cancel")
+        if self.max_work is not None and done > self.max_work:
+            raise self.__time_error("work")
+        if time.time() > self.__deadline:
+            raise self.__time_error()
+        self.__next_check = self.work + 256 if self.max_work is None else min(self.work + 256, self.max_work + 1)
+
+    @_timed("put_values")
+    def __put_values(self, game_dict: Candidates, method: int, pick: int = 0, coord: int = 0) -> bool:
         """ private method put_values runs the alter_child private method on a loop until
             there are not any sudoku cell with only one possibility left (the cell is set to that possibility)
+            nor any value with only one possible cell left inside a row, column or quadrant
             or one of this possibility is an incorrect guess"""
         while True:
             if method != 2:
-                current_pick = {key: value for key, value in game_dict.items() if len(value) == 1 and 0 not in value}
-                if len(current_pick) != 0:
-                    for answer in current_pick:
-                        if method == 0:
-                            self.puzzle.at[f"row{self.tr(answer[0])}", f"col{self.tr(answer[1])}"] \
-                                = current_pick[answer][0]
-                            if not self.__alter_child(game_dict, answer):
-                                return False
-                            self.iterations += 1
-                        else:
-                            if not self.__alter_child(game_dict, answer):
-                                return False
-                        break
+                answer: int | None = game_dict.next_single()
+                if answer is not None:
+                    pick = game_dict.masks[answer].bit_length()
+                elif (hidden := game_dict.next_hidden()) is not None:
+                    answer, pick = hidden
                 else:
                     break
+                self.work += 1
+                if self.work >= self.__next_check:
+                    self.__check_limits()
+                if not self.__alter_child(game_dict, answer, pick):
+                    return False
+                if method == 0:
+                    self.iterations += 1
             else:
-                self.puzzle.at[f"row{self.tr(coord[0])}", f"col{self.tr(coord[1])}"] = pick
-                if not self.__alter_child(game_dict, coord, pick, 1):
+                self.work += 1
+                if self.work >= self.__next_check:
+                    self.__check_limits()
+                if not self.__alter_child(game_dict, coord, pick):
                     return False
                 method -= method
         return True
 
-    def __alter_child(self, game_dict: dict, position: str, pick: int = 0, mode: int = 0) -> bool:
+    def __propagate(self, game_dict: Candidates, method: int = 1) -> bool:
+        """ private method propagate runs the put_values private method and then the strategies of the
+            strategies property in order, every time a strategy removes a possibility the loop starts again
+            from put_values, it stops when no strategy finds anything or the game turns out to be invalid"""
+        while True:
+            if not self.__put_values(game_dict, method):
+                return False
+            if self.__end(game_dict):
+                return True
+            if not self.__apply_strategies(game_dict):
+                return True
+            if game_dict.dead:
+                return False
+
+    @_timed("strategies")
+    def __apply_strategies(self, game_dict: Candidates) -> bool:
+        """ private method apply_strategies runs the strategies of the strategies property in order until
+            one of them removes a possibility from game_dict, returns False if none of them did"""
+        for name in self.strategies:
+            if STRATEGIES[name](game_dict):
+                self.strategy_hits[name] += 1
+                return True
+        return False
+
+    @staticmethod
+    def __alter_child(game_dict: Candidates, position: int, pick: int) -> bool:
         """ private method alter_child takes a sudoku cell set that cell to a possible value, delete that
             possibility as a valid choice for that cell and related cells while checking if the chose value
             was a valid guess"""
-        if mode == 0:
-            pick: int = game_dict[position][pick]
-            game_dict[position]: list = [pick]
-        else:
-            if len(game_dict[position]) >= 2:
-                game_dict[position]: list = [pick]
-        new_sequence: dict[str:list] = {location: list_options for location, list_options in game_dict.items()
-                                        if self._filtro(location, position) and pick in list_options}
-        for list_locations in new_sequence:
-            if len(new_sequence[list_locations]) > 1 or list_locations == position:
-                game_dict[list_locations].remove(pick)
-            else:
-                game_dict[list_locations].extend([0, 0])
-                return False
-        return True
+        return game_dict.place(position, pick)
 
-    def __possibility_compare(self, game_dict: dict,
+    @_timed("possibility_compare")
+    def __possibility_compare(self, game_dict: Candidates,
                               option_len: int, gen_safe: list | None = None, is_alt: bool = True) -> bool:
         """ private method possibility_compare takes all the sudoku cells with an equal number of
             possible values and sort them, then takes one of the cells to test each of its possible values
-            to see if any is a valid play, if there are no valid plays that branch dies out"""
+            to see if any is a valid play, if there are no valid plays that branch dies out, the valid plays
+            (cell, value) of the first cell are saved in gen_safe and if a play solves the game it is kept"""
         if gen_safe is not None:
             gen_safe.clear()
-        len_values: list = [[key, value] for key, value in game_dict.items() if len(value) == option_len + 1]
+        len_values: list[int] = [cell for cell, mask in enumerate(game_dict.masks)
+                                 if mask.bit_count() == option_len + 1]
         len_values.sort(key=lambda child_item: self.__get_info(child_item, game_dict), reverse=True)
         if is_alt:
             len_values = len_values[:1]
         for count, item in enumerate(len_values):
-            for value in range(0, option_len + 1):
-                alt_game = copy.deepcopy(game_dict)
-                if self.__alter_child(alt_game, item[0], value):
-                    self.__put_values(alt_game, 1)
-                if len(tuple(filter(lambda value: 0 in value, alt_game.values()))) == 0:
+            for value in game_dict.options(game_dict.masks[item]):
+                mark: int = game_dict.checkpoint()
+                if self.__alter_child(game_dict, item, value):
+                    self.__put_values(game_dict, 1)
+                if not game_dict.dead:
                     if gen_safe is not None and count == 0:
                         self.iterations += 1
-                        if is_alt:
-                            gen_safe.append(f"{item[1][value]} {item[0]}")
-                        else:
-                            gen_safe.append((f"{item[1][value]} {item[0]}", None))
-                    if self.__end(alt_game):
-                        if is_alt:
-                            self.solution_path.append(f"+{item[1][value]} {item[0]}")
-                        else:
-                            self.__put_values(game_dict, 2, item[1][value], item[0])
+                        gen_safe.append((item, value))
+                    if self.__end(game_dict):
                         return True
+                game_dict.rollback(mark)
         return False
 
-    def __get_info(self, element: list, father_element: dict) -> int:
+    @staticmethod
+    def __get_info(element: int, father_element: Candidates) -> int:
         """ private method get_info sort sudoku cells to determinate which one have possibilities
             that are present the most in their related cells"""
         usefulness: int = 0
-        for option in father_element[element[0]]:
-            usefulness += len({key: val for key, val in father_element.items()
-                               if self._filtro(element[0], key) and option in val})
+        masks: list[int] = father_element.masks
+        for option in father_element.options(masks[element]):
+            bit: int = 1 << (option - 1)
+            # the cell itself always counts as its own kin
+            usefulness += 1 + len(tuple(cell for cell in father_element.layout.peers[element] if masks[cell] & bit))
         return usefulness
 
-    def __next_node(self, next_path: tuple) -> str | tuple:
+    def __next_node(self, next_path: SearchNode) -> str | tuple:
         """ private method get next_node takes a branch created from the choice of a possible value
                     of a cell and create as many new branches as posible values the selected sudoku cell
                     inside the branch had"""
-        if self.solution_path:
+        if self.solved_node is not None:
             return "void"
         next_gen: list = []
-        for last_place in next_path[1:]:
-            new_path = f"{next_path[0]}+{last_place}" if last_place is not None else next_path[0]
-            self.solution_path.append(new_path)
-            new_dict = self.__testing(return_alt=True)
-            if isinstance(new_dict, dict):
-                min_value = min(tuple(len(options) for options in new_dict.values() if len(options) > 0))
-                new_path = self.__is_valid_game(new_dict, min_value, new_path)
-                if new_path == "solved":
-                    return new_path
-                elif new_path == "void":
-                    continue
-            else:
-                raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
-                                 "\nbut the sudoku seems to be not.")
-            min_value = min(tuple(len(options) for options in new_dict.values() if len(options) > 0))
-            next_values: list = []
-            is_solution = self.__possibility_compare(new_dict, min_value - 1, gen_safe=next_values)
-            if is_solution:
-                new_path += self.solution_path.pop(0)
-                self.solution_path.append(new_path)
-                return "solved"
-            elif next_values:
-                next_gen.append((new_path, *next_values))
+        new_dict: Candidates = self.unknown_values
+        new_dict.restore(next_path)
+        mark: int = new_dict.checkpoint()
+        for value in next_path.options:
+            new_dict.rollback(mark)
+            state, new_path, next_values = self.__branch(new_dict, value, next_path.cell)
+            if state == "solved":
+                self.solved_node = SearchNode(new_dict, 0, (), tuple(new_path), next_path)
+                return state
+            elif state == "open":
+                next_gen.append(SearchNode(new_dict, next_values[0][0], tuple(value for _, value in next_values),
+                                           tuple(new_path), next_path))
+        next_path.release()
         if next_gen:
             return tuple(next_gen)
         return "void"
 
-    def __testing(self, return_alt: bool = False) -> bool | dict:
-        """ private method testing checks if the chose combination of branches that hte program found
-            is a solution for the sudoku"""
-        duplicate_dict = copy.deepcopy(self.unknown_values)
-        was_alter = re.findall(r"\*-([^+*]+)\*", self.solution_path[0])
-        if was_alter:
-            for finding in was_alter:
-                val_to_change = finding.split("-")
-                for change in val_to_change:
-                    value, key = change.split()
-                    if int(value) in duplicate_dict[key]:
-                        duplicate_dict[key].remove(int(value))
-            put_path = re.sub(r"\*-([^+*]+)\*", "", self.solution_path.pop(0))
-            if "*" in put_path:
-                put_path = re.sub(r"\*", "", put_path)
-            self.solution_path.append(put_path)
-        duplicate_game = copy.deepcopy(self.puzzle)
-        solving_path = self.solution_path[0].split("+")
-        for val_position in solving_path:
-            contents = val_position.split()
-            self.__put_values(duplicate_dict, 2, int(contents[0]), contents[1])
-        if self.__end(duplicate_dict):
-            return True
-        self.solution_path.clear()
-        self.puzzle = duplicate_game
-        if return_alt:
-            return duplicate_dict
-        return False
+    def __depth_search(self, cell: int, options: tuple) -> None:
+        """ private method depth_search follows one branch at a time until it solves the game or proves
+            to be wrong, the guesses left at each depth are kept in a stack and the game is rolled back to
+            the checkpoint of its depth instead of being copied, so memory grows with the depth of the
+            search and not with its width"""
+        game_dict: Candidates = self.unknown_values
+        stack: list[tuple[int, int, iter]] = [(game_dict.checkpoint(), cell, iter(options))]
+        moves: list[list[tuple[int, int]]] = []
+        while stack:
+            mark, cell, values = stack[-1]
+            game_dict.rollback(mark)
+            del moves[len(stack) - 1:]
+            value: int | None = next(values, None)
+            if value is None:
+                stack.pop()
+                continue
+            state, new_path, next_values = self.__branch(game_dict, value, cell)
+            if state == "solved":
+                self.solved_node = SearchNode(game_dict, 0, (), tuple(chain.from_iterable(moves)) + tuple(new_path))
+                return
+            elif state == "open":
+                moves.append(new_path)
+                stack.append((game_dict.checkpoint(), next_values[0][0], iter(tuple(option for _, option
+                                                                                     in next_values))))
+                if self.stats is not None:
+                    self.stats.peak_frontier = max(self.stats.peak_frontier, len(stack))
+        raise InputError("Couldn't found a solution for your sudoku, initial numbers seem valid "
+                         "\nbut the sudoku seems to be not.")
 
-    def __is_valid_game(self, current_option: dict, min_options: int, last_path: str) -> str:
+    def __branch(self, new_dict: Candidates, value: int, cell: int) -> tuple[str, list, list]:
+        """ private method branch plays value in cell and propagates it, it returns "solved" if that solved
+            the game, "void" if the play was wrong or "open" if the game still needs more guesses, along
+            with the moves (value, cell) made and the (cell, value) guesses left for the next branch"""
+        new_path: list[tuple[int, int]] = [(value, cell)]
+        next_values: list = []
+        if not self.__put_values(new_dict, 2, value, cell) or not self.__propagate(new_dict):
+            return "void", new_path, next_values
+        if self.__end(new_dict):
+            return "solved", new_path, next_values
+        min_value = min(tuple(mask.bit_count() for mask in new_dict.masks if mask))
+        is_valid = self.__is_valid_game(new_dict, min_value, new_path)
+        if is_valid != "valid":
+            return is_valid, new_path, next_values
+        min_value = min(tuple(mask.bit_count() for mask in new_dict.masks if mask))
+        if self.__possibility_compare(new_dict, min_value - 1, gen_safe=next_values):
+            new_path.append((next_values[-1][1], next_values[-1][0]))
+            return "solved", new_path, next_values
+        return ("open" if next_values else "void"), new_path, next_values
+
+    @_timed("is_valid_game")
+    def __is_valid_game(self, current_option: Candidates, min_options: int, last_path: list) -> str:
         """ private method is_valid_game search for patterns inside the branches to see if they are
-            valid games or not"""
-        current_dict: dict[str:list] = {key: value for key, value
-                                        in current_option.items() if len(value) == min_options}
-        removed: set = set()
+            valid games or not, the values it finds are played and added as (value, cell) to last_path"""
+        current_dict: dict[int: int] = {key: value for key, value
+                                        in enumerate(current_option.masks) if value.bit_count() == min_options}
         for child in current_dict:
             for child_relation in range(0, 3):
-                related_items: dict[str:list] = {key: value for key, value in current_option.items()
-                                                 if key[child_relation] == child[child_relation] and value}
+                related_items: dict[int: int] = {key: current_option.masks[key] for key
+                                                 in current_option.layout.cell_units[child][child_relation]
+                                                 if current_option.masks[key]}
                 is_case = list(filter(lambda num: num == current_dict[child], related_items.values()))
                 # filter case 0) {[6, 8], [6, 8], [6, 15], [6, 8, 12]}
                 # here  the third and forth entries must be 15 and 12 otherwise
                 # the 2 first entries would end up with the same values making it invalid
                 if len(is_case) == min_options and len(is_case) != len(related_items):
-                    remove_conflicts: dict[str:list] = {key: sorted(list(set(item) - set(is_case[0])))
+                    remove_conflicts: dict[int: int] = {key: item & ~is_case[0]
                                                         for key, item in related_items.items() if item != is_case[0]}
-                    if remove_conflicts:
-                        removed_vals = ""
-                        for change in remove_conflicts:
-                            if len(remove_conflicts[change]) > 1:
-                                removed_vals += "-"
-                                current_option[change]: list = remove_conflicts[change]
-                                removed_vals += "-".join((f"{val} {change}" for val in is_case[0]))
-                        if removed_vals:
-                            removed.add(removed_vals)
-                    remove_conflicts: dict[str:list] = {key: val for key, val in remove_conflicts.items()
-                                                        if len(val) == 1}
+                    for change in remove_conflicts:
+                        if remove_conflicts[change].bit_count() > 1:
+                            for val in current_option.options(is_case[0]):
+                                current_option.remove(change, val)
+                    remove_conflicts: dict[int: int] = {key: val for key, val in remove_conflicts.items()
+                                                        if val.bit_count() == 1}
                     if remove_conflicts:
                         for one_option in remove_conflicts:
-                            current_option[one_option]: list = remove_conflicts[one_option]
-                            if not self.__put_values(current_option, 1):
+                            if not current_option.place(one_option, remove_conflicts[one_option].bit_length()) \
+                                    or not self.__put_values(current_option, 1):
                                 return "void"
                             else:
-                                if not (tuple(filter(None, current_option.values()))):
-                                    last_path += f"+{remove_conflicts[one_option][0]} {one_option}"
-                                    if removed:
-                                        last_path += f"*{''.join(removed)}*"
-                                    self.solution_path.append(last_path)
+                                last_path.append((remove_conflicts[one_option].bit_length(), one_option))
+                                if self.__end(current_option):
                                     return "solved"
-                                else:
-                                    last_path += f"+{remove_conflicts[one_option][0]} {one_option}"
-                        related_items = {key: value for key, value in current_option.items()
-                                         if key[child_relation] == child[child_relation] and value}
-                case_options = list(flatten(list(related_items.values())))
+                        related_items = {key: current_option.masks[key] for key
+                                         in current_option.layout.cell_units[child][child_relation]
+                                         if current_option.masks[key]}
+                case_options: int = 0
+                for option_mask in related_items.values():
+                    case_options |= option_mask
                 # filter case 1) {[2,4], [2, 4], [2, 4]} 2) {[2, 4], [2, 4], [1, 3, 5], [3, 5], [1, 4], [1, 5]}
-                if len(is_case) >= min_options + 1 or len(related_items) > len(set(case_options)):
+                if len(is_case) >= min_options + 1 or len(related_items) > case_options.bit_count():
                     return "void"
-                elif len(related_items) == len(set(case_options)):
+                elif len(related_items) == case_options.bit_count():
                     # filter case 2) {[2, 4], [2, 4], [7, 8], [2, 5], [5, 4]}
-                    get_unique: list = unique_to_each(*related_items.values())
-                    if tuple(filter(lambda group: len(group) > 1, get_unique)):
+                    get_unique: list[int] = []
+                    for key, value in related_items.items():
+                        others: int = 0
+                        for other_key, other_value in related_items.items():
+                            if other_key != key:
+                                others |= other_value
+                        get_unique.append(value & ~others)
+                    if tuple(filter(lambda group: group.bit_count() > 1, get_unique)):
                         return "void"
                     else:
-                        get_unique: tuple = tuple(flatten(get_unique))
+                        get_unique: tuple = tuple(chain.from_iterable(current_option.options(group)
+                                                                      for group in get_unique))
                         if get_unique:
                             # filter case 3) {[2, 4], [2, 4], [7, 5], [2, 5], [5, 4]}
                             for val in get_unique:
-                                is_case = tuple(key for key, value in related_items.items() if val in value)
+                                is_case = tuple(key for key, value in related_items.items()
+                                                if value & (1 << (val - 1)))
                                 if is_case:
-                                    current_option[is_case[0]]: list = [val]
-                                    if not self.__put_values(current_option, 1):
+                                    if not current_option.place(is_case[0], val) \
+                                            or not self.__put_values(current_option, 1):
                                         return "void"
                                     else:
-                                        if not(tuple(filter(None, current_option.values()))):
-                                            last_path += f"+{val} {is_case[0]}"
-                                            if removed:
-                                                last_path += f"*{''.join(removed)}*"
-                                            self.solution_path.append(last_path)
+                                        last_path.append((val, is_case[0]))
+                                        if self.__end(current_option):
                                             return "solved"
-                                        else:
-                                            last_path += f"+{val} {is_case[0]}"
-                            if removed:
-                                last_path += f"*{''.join(removed)}*"
-                            return last_path
-        if removed:
-            last_path += f"*{''.join(removed)}*"
-        return last_path
+                            return "valid"
+        return "valid"
 
     @staticmethod
-    def __end(dict_game: dict[str: list]) -> bool:
+    def __end(dict_game: Candidates) -> bool:
         """ static private method end checks if the game has been solved"""
-        return True if len(tuple(position for position in dict_game.values() if len(position) > 0)) == 0 else False
+        return dict_game.unsolved == 0 and not dict_game.dead
 
     def __str__(self) -> str:
-        if self.puzzle is None and self.sudoku is None:
+        if self.solved_grid is None and self.grid is None and self.sudoku is None:
             raise SudokuError("Can't call string method of class Solution before entering or reading"
                               " a valid sudoku game.")
-        elif self.puzzle is None:
+        elif self.solved_grid is None:
             return str(self.sudoku)
         else:
             if self.color:
@@ -800,6 +1969,75 @@ class Solution(Sudoku):
                 return str(self.puzzle)
 
 
+def solve_many(games: Iterable[str], max_time: int | float = 10, engine: str | None = None,
+               max_work: int | None = None, raw_level: bool = False, stats: bool = False,
+               cache=None) -> Iterator[dict]:
+    """ function solve_many is a generator that solves the sudoku strings of games (in any of the formats the
+    Sudoku size property takes) one after the other and yields a dict for each one with the game (start key),
+    the solved game or None (end key), the extra_info keys and the error raised while solving it or None
+    (error key), a single Solution object is kept for each size so no dataframe or file is used on the way,
+    the engine is dancing links for 16 by 16 sudokus and propagation for the rest if none is given,
+    raw_level is passed to extra_info, if stats is True the stats of each solve are added (stats key) and
+    cache (a SolutionCache of the symmetry module) is shared by the solvers of every size"""
+    solvers: dict[int: Solution] = {}
+    for game in games:
+        record: dict = {"start": game, "end": None, "start_vals": 0, "solving_time": "0", "difficulty": "0/100",
+                        "error": None}
+        try:
+            size, givens = _parse_game(game)
+            solver: Solution | None = solvers.get(size)
+            if solver is None:
+                solver = solvers[size] = Solution(size)
+                solver.max_time = max_time
+                solver.max_work = max_work
+                solver.engine = engine if engine is not None else ("dlx" if size > 9 else "propagation")
+                solver.stats = SolveStats() if stats else None
+                solver.cache = cache
+            record["start_vals"] = len(givens)
+            if len(givens) < _min_givens(size):
+                raise InputError(f"The minimum amount of number to solve a sudoku of\nsize {size} is "
+                                 f"{_min_givens(size)} and your sudoku has {len(givens)}.")
+            seen: set[int] = set()
+            for cell, value in givens:
+                for unit, _ in LAYOUTS[size].cell_places[cell]:
+                    if unit * size + value in seen:
+                        raise InputError(f"input error: can't have two or more equal values ({value}) in the same "
+                                         "row, column or quadrant.")
+                    seen.add(unit * size + value)
+            record["end"] = solver._solve_givens(givens)
+            record.update(solver.extra_info(raw_level=raw_level))
+        except (InputError, SudokuError) as error:
+            record["error"] = error
+        yield record
+
+
+# solvers, stop value and work value of a worker process of the parallel search, set by _start_worker and
+# _expand_shard, they stay None in the main process
+_STOP = None
+_WORK = None
+_SOLVERS: dict[tuple: Solution] = {}
+
+
+def _start_worker(stop, work) -> None:
+    """ function _start_worker keeps the shared stop and work values of the pool inside the worker process"""
+    global _STOP, _WORK
+    _STOP = stop
+    _WORK = work
+
+
+def _expand_shard(size: int, strategies: tuple[str], stats: bool, start: int, nodes: list[SearchNode],
+                  deadline: float = float("inf"), max_work: int | None = None) -> tuple | None:
+    """ function _expand_shard expands a shard of the search frontier with a solver kept by the worker
+    process for each sudoku size and strategies, the solver collects stats if stats is True and stops
+    at the deadline and max work of the whole search"""
+    solver: Solution | None = _SOLVERS.get((size, strategies))
+    if solver is None:
+        solver = _SOLVERS[(size, strategies)] = Solution(size)
+        solver.strategies = strategies
+    solver.stats = SolveStats() if stats else None
+    return solver._expand_shard(start, nodes, deadline, max_work)
+
+
 class SudokuError(Exception):
     """ class SudokuError gets raised if a method it's called before
     doing something before, when a solution for a sudoku cannot be found
@@ -0,0 +1,296 @@
+from collections import OrderedDict
+from itertools import permutations, product
+from math import isqrt
+from data import Database
+from sudoku import InputError, _SYMBOLS, _parse_game
+
+# most partial row orders that can tie for the canonical pattern and most (row order, column order) pairs
+# that can tie for the canonical values, games with more symmetries than that (full or nearly empty grids,
+# filled diagonals) have no canonical form as finding it would take exponential time
+_MAX_STATES: int = 64
+_MAX_TIES: int = 512
+
+
+class Transform:
+    """ class Transform is a symmetry of a sudoku: an optional transposition (transposed), the order of the
+    rows and columns (rows[i] is the row that ends up as row i, each band and stack keeps its rows or
+    columns together) and the relabelling of the values (labels[value - 1] is the new value), forward moves
+    a game into the canonical orientation and backward moves it back"""
+
+    def __init__(self, size: int, transposed: bool, rows: tuple[int], cols: tuple[int], labels: tuple[int]):
+        self.size: int = size
+        self.transposed: bool = transposed
+        self.rows: tuple[int] = rows
+        self.cols: tuple[int] = cols
+        self.labels: tuple[int] = labels
+
+    def __source(self, row: int, col: int) -> int:
+        """ private method source returns the cell of the original game that ends up in row, col"""
+        if self.transposed:
+            return self.cols[col] * self.size + self.rows[row]
+        return self.rows[row] * self.size + self.cols[col]
+
+    def forward(self, values: list[int]) -> list[int]:
+        """ method forward returns the values (0 for empty cells) of a game moved by the transform"""
+        return [self.labels[values[self.__source(row, col)] - 1] if values[self.__source(row, col)] else 0
+                for row in range(self.size) for col in range(self.size)]
+
+    def backward(self, values: list[int]) -> list[int]:
+        """ method backward returns the values (0 for empty cells) of a game moved back by the transform"""
+        original: list[int] = [0] * self.size ** 2
+        for row in range(self.size):
+            for col in range(self.size):
+                if values[row * self.size + col]:
+                    original[self.__source(row, col)] = self.labels.index(values[row * self.size + col]) + 1
+        return original
+
+
+def _pattern(masks: list[int], rows: tuple[int], size: int, base: int) -> tuple[tuple, list[list[int]]]:
+    """ function _pattern returns the smallest pattern of initial values (row by row, an empty cell before an
+    initial value) the rows in that order can show by sorting the columns inside each stack and the stacks,
+    along with the column orders of every stack, masks holds the initial values of each row as bits"""
+    depth: int = len(rows)
+    vectors: list[int] = [0] * size
+    for row in rows:
+        for col in range(size):
+            vectors[col] = vectors[col] << 1 | (masks[row] >> col) & 1
+    stacks: list[tuple[int, list[int]]] = []
+    for stack in range(base):
+        cols: list[int] = sorted(range(stack * base, stack * base + base), key=lambda col: vectors[col])
+        key: int = 0
+        for shift in range(depth - 1, -1, -1):
+            for col in cols:
+                key = key << 1 | (vectors[col] >> shift) & 1
+        stacks.append((key, cols))
+    stacks.sort(key=lambda item: item[0])
+    pattern: tuple = tuple(tuple((key >> ((depth - 1 - row) * base)) & ((1 << base) - 1) for key, _ in stacks)
+                           for row in range(depth))
+    return pattern, [cols for _, cols in stacks]
+
+
+def _masks(size: int, values: list[int]) -> dict[bool: list[int]]:
+    """ function _masks returns the initial values of each row as bits, for the game (False key) and for
+    its transposition (True key)"""
+    return {
+        False: [sum(1 << col for col in range(size) if values[row * size + col]) for row in range(size)],
+        True: [sum(1 << row for row in range(size) if values[row * size + col]) for col in range(size)]
+    }
+
+
+def _row_orders(size: int, masks: dict[bool: list[int]],
+                check: callable = None) -> list[tuple[bool, tuple[int]]] | None:
+    """ function _row_orders returns as (transposed, rows) the row orders of the game and of its transposition
+    that give the smallest pattern of initial values (masks comes from the _masks function), they are built
+    row by row keeping only the partial orders that tie for the smallest pattern so far, None is returned
+    if more than _MAX_STATES of them tie, check (if any) gets called for every partial order expanded"""
+    base: int = isqrt(size)
+    states: list[tuple[bool, tuple[int]]] = [(False, ()), (True, ())]
+    for depth in range(size):
+        best: tuple | None = None
+        following: list[tuple[bool, tuple[int]]] = []
+        for transposed, rows in states:
+            if check is not None:
+                check()
+            if depth % base:
+                band: int = rows[-1] // base
+                options: list[int] = [row for row in range(band * base, band * base + base) if row not in rows]
+            else:
+                used: set[int] = {row // base for row in rows}
+                options: list[int] = [row for row in range(size) if row // base not in used]
+            for row in options:
+                pattern, _ = _pattern(masks[transposed], rows + (row,), size, base)
+                if best is None or pattern < best:
+                    best, following = pattern, []
+                if pattern == best:
+                    if len(following) >= _MAX_STATES:
+                        return None
+                    following.append((transposed, rows + (row,)))
+        states = following
+    return states
+
+
+def _col_orders(stacks: list[list[int]], vectors: list[int], stack_keys: list[tuple],
+                limit: int) -> list[tuple[int]] | None:
+    """ function _col_orders returns the column orders that keep the smallest pattern, columns with the same
+    initial values inside a stack and stacks with the same initial values can be swapped, None is returned
+    if there are more than limit of them"""
+    def swaps(items: list, key) -> list[list] | None:
+        groups: list[list] = []
+        for item in items:
+            if groups and key(groups[-1][0]) == key(item):
+                groups[-1].append(item)
+            else:
+                groups.append([item])
+        choices: list[tuple] | None = _product([list(permutations(group)) for group in groups], limit)
+        return None if choices is None else [list(flat for group in choice for flat in group) for choice in choices]
+
+    stack_orders: list[list] | None = swaps(list(zip(stack_keys, stacks)), lambda item: item[0])
+    if stack_orders is None:
+        return None
+    orders: list[tuple[int]] = []
+    for stack_order in stack_orders:
+        inner: list[list[list[int]] | None] = [swaps(cols, lambda col: vectors[col]) for _, cols in stack_order]
+        choices: list[tuple] | None = None if None in inner else _product(inner, limit - len(orders))
+        if choices is None:
+            return None
+        orders.extend(tuple(col for cols in choice for col in cols) for choice in choices)
+    return orders
+
+
+def _product(options: list[list], limit: int) -> list[tuple] | None:
+    """ function _product returns the combinations of one item of each list, or None if there are more
+    than limit of them, which is known before building any"""
+    total: int = 1
+    for items in options:
+        total *= len(items)
+    if total > limit:
+        return None
+    return list(product(*options))
+
+
+def canonical(size: int, values: list[int], check: callable = None) -> tuple[str, Transform] | None:
+    """ function canonical returns the canonical form of the game of the given size with values (0 for empty
+    cells, row by row) and the transform that moves the game into it, games that are copies of each other
+    with the values relabelled, rows or columns swapped inside their bands or stacks, bands or stacks
+    swapped or transposed get the same canonical form. The initial values are first moved to the smallest
+    pattern the symmetries allow and then the values are relabelled in the order they show up, keeping the
+    smallest result among the orders that tie for the pattern. None is returned for games with so many
+    symmetries that more orders than the tie limits tie, check (if any) gets called as the orders are
+    tried and can raise to stop"""
+    base: int = isqrt(size)
+    best: tuple | None = None
+    found: Transform | None = None
+    masks: dict[bool: list[int]] = _masks(size, values)
+    row_orders: list[tuple[bool, tuple[int]]] | None = _row_orders(size, masks, check)
+    if row_orders is None:
+        return None
+    tried: int = 0
+    for transposed, rows in row_orders:
+        if check is not None:
+            check()
+        vectors: list[int] = [0] * size
+        for row in rows:
+            for col in range(size):
+                vectors[col] = vectors[col] << 1 | (masks[transposed][row] >> col) & 1
+        _, stacks = _pattern(masks[transposed], rows, size, base)
+        stack_keys: list[tuple] = [tuple(vectors[col] for col in cols) for cols in stacks]
+        col_orders: list[tuple[int]] | None = _col_orders(stacks, vectors, stack_keys, _MAX_TIES - tried)
+        if col_orders is None:
+            return None
+        tried += len(col_orders)
+        for cols in col_orders:
+            labels: list[int] = [0] * size
+            sequence: list[int] = []
+            count: int = 0
+            for row in rows:
+                for col in cols:
+                    value: int = values[(col * size + row) if transposed else (row * size + col)]
+                    if value:
+                        if not labels[value - 1]:
+                            count += 1
+                            labels[value - 1] = count
+                        sequence.append(labels[value - 1])
+            if best is None or sequence < best:
+                # values missing from the game take the labels left in order
+                for value in range(size):
+                    if not labels[value]:
+                        count += 1
+                        labels[value] = count
+                best, found = sequence, Transform(size, transposed, rows, cols, tuple(labels))
+    form: list[int] = found.forward(values)
+    return "".join(_SYMBOLS[value - 1] if value else "-" for value in form), found
+
+
+def canonical_form(game: str) -> str | None:
+    """ function canonical_form returns the canonical form of a sudoku string in any of the formats of the
+    stringify method start key or None if it has too many symmetries, an InputError is raised for invalid
+    strings"""
+    size, givens = _parse_game(game)
+    values: list[int] = [0] * size ** 2
+    for cell, value in givens:
+        values[cell] = value
+    found: tuple[str, Transform] | None = canonical(size, values)
+    return None if found is None else found[0]
+
+
+class SolutionCache:
+    """ class SolutionCache keeps the solutions of the sudokus already solved by their canonical form, so a
+    copy of a solved sudoku with its values relabelled, rows and columns swapped or transposed is answered
+    without searching it again, up to max_entries solutions are kept in memory dropping the least recently
+    used first and, if db_path is given, every solution is also saved in the solution_cache table of that
+    sqlite database so the cache outlives the program"""
+
+    def __init__(self, max_entries: int = 1024, db_path: str | None = None):
+        self.max_entries = max_entries
+        self.db_path: str | None = db_path
+        self.entries: OrderedDict[str: tuple[str, int]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        if db_path is not None:
+            with Database(db_path=db_path) as cache_db:
+                cache_db.write_db("CREATE TABLE IF NOT EXISTS solution_cache (game TEXT PRIMARY KEY, "
+                                  "solution TEXT NOT NULL, iterations INTEGER NOT NULL)")
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, new_val: int) -> None:
+        if isinstance(new_val, int) and not isinstance(new_val, bool) and new_val > 0:
+            self._max_entries = new_val
+        else:
+            raise InputError(f"Expected an int greater than 0 got {new_val} instead.")
+
+    def lookup(self, size: int, values: list[int],
+               check: callable = None) -> tuple[tuple[list[int], int] | None, tuple[str, Transform] | None]:
+        """ method lookup returns the solution of the game of the given size with values (0 for empty cells)
+        in the orientation of the game and the iterations it took to solve it, or None if the game is not
+        in the cache, along with the canonical form and transform of the game to pass to the store method
+        (None for games with too many symmetries, which are always a miss), check is passed to canonical"""
+        key: tuple[str, Transform] | None = canonical(size, values, check)
+        if key is None:
+            self.misses += 1
+            return None, None
+        form, transform = key
+        entry: tuple[str, int] | None = self.entries.get(form)
+        if entry is not None:
+            self.entries.move_to_end(form)
+        elif self.db_path is not None:
+            with Database(db_path=self.db_path) as cache_db:
+                entry = next(cache_db.read_db(("SELECT solution, iterations FROM solution_cache WHERE game = ?",
+                                               [form])), None)
+            if entry is not None:
+                self.__keep(form, tuple(entry))
+        if entry is None:
+            self.misses += 1
+            return None, key
+        self.hits += 1
+        return (transform.backward([_SYMBOLS.index(symbol) + 1 for symbol in entry[0]]), entry[1]), key
+
+    def store(self, size: int, values: list[int], solution: list[int], iterations: int,
+              key: tuple[str, Transform] | None = None) -> None:
+        """ method store saves the solution of the game of the given size with values (0 for empty cells)
+        and the iterations it took to solve it, key is the canonical form and transform lookup returned for
+        the game, it's found again if not given and nothing is saved for games without one"""
+        if key is None:
+            key = canonical(size, values)
+            if key is None:
+                return
+        form, transform = key
+        entry: tuple[str, int] = ("".join(_SYMBOLS[value - 1] for value in transform.forward(solution)), iterations)
+        self.__keep(form, entry)
+        if self.db_path is not None:
+            with Database(db_path=self.db_path) as cache_db:
+                cache_db.write_db(("INSERT OR IGNORE INTO solution_cache (game, solution, iterations) "
+                                   "VALUES (?, ?, ?)", [form, *entry]))
+
+    def __keep(self, form: str, entry: tuple[str, int]) -> None:
+        """ private method keep saves an entry in memory dropping the least recently used one if full"""
+        self.entries[form] = entry
+        self.entries.move_to_end(form)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.entries)
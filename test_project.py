@@ -1,17 +1,25 @@
-from project import _valid_play, _solve, _read, _save_game
+from project import _valid_play, _solve, _read, _save_game, _is_unique, _saved_game, _index_games, _entered
 from pathlib import Path
-from sudoku import Solution, SudokuError, InputError
+from sudoku import Solution, SolveStats, SudokuError, InputError, solve_many
+from generator import generate, main as generator_main
+from benchmark import load_corpus, run_benchmark, compare
+from symmetry import SolutionCache, canonical_form
+from codec import decode_games, encode_games
+from render import Board, GREEN, RED
+from data import Database
+import tempfile
 import os
 
 
 def test__valid_play():
     """ test that a valid play is detected:
     the size parameter is not entered by the user but is stored in the
-    database where games are stored, so is always going to be 4, 9 or 16
+    database where games are stored, so is always a valid size like 4, 9, 16 or 25
     if the function valid play returns a not empty list then the play was valid
     """
     valid_inputs: dict = {"111": 4, "333": 9, "abc": 16, "976": 9, "ggg": 16,
-                          "424": 4, "1c9": 16, "c92": 16, "39f": 16, "251": 16}
+                          "424": 4, "1c9": 16, "c92": 16, "39f": 16, "251": 16,
+                          "ppp": 25, "9ao": 25}
     for play, size in valid_inputs.items():
         assert len(_valid_play(play, size)) != 0
 
@@ -19,12 +27,12 @@ def test__valid_play():
 def test__valid_play_2():
     """ test that an invalid play is detected:
     the size parameter is not entered by the user but is stored in the
-    database where games are stored, so is always going to be 4, 9 or 16
+    database where games are stored, so is always a valid size like 4, 9, 16 or 25
     if the function valid play return an empty list then the play was not valid
     """
     invalid_inputs: dict = {"191": 4, "335": 4, "97a": 9, "f76": 9, "gg16": 16,
                             "4241": 4, "1c1": 4, "c92": 9, ".---78f": 16, "000": 9,
-                            "not valid": 4, "test56\n": 16}
+                            "not valid": 4, "test56\n": 16, "qa1": 25}
     for play, size in invalid_inputs.items():
         assert len(_valid_play(play, size)) == 0
 
@@ -65,6 +73,26 @@ def test__save_game_2():
     assert _save_game(saved_game, db_file, test=True)
 
 
+def test__saved_game():
+    """ test that a game already in the database is found by its start string before solving it:
+    the _saved_game function returns the saved solution, initial values and difficulty of a saved game
+    and None for a game that is not saved or a database without the sudokus table, the index on the start
+    strings is created only once
+    """
+    db_file: str = os.path.join(tempfile.mkdtemp(), "sudoku_table.db")
+    _index_games(db_file)
+    assert _saved_game("12233441|||", db_file) is None
+    with Database(db_path=db_file) as new_db:
+        new_db.write_db("CREATE TABLE sudokus (id INTEGER PRIMARY KEY, start_str TEXT, end_str TEXT, "
+                        "init_vals INTEGER, difficulty INTEGER, size INTEGER)")
+        new_db.write_db(("INSERT INTO sudokus (start_str, end_str, init_vals, difficulty, size) VALUES (?, ?, ?, ?, ?)",
+                         ("12233441|||", "2341142332144132", 4, 6, 4)))
+    _index_games(db_file)
+    _index_games(db_file)
+    assert _saved_game("12233441|||", db_file) == ("2341142332144132", 4, 6)
+    assert _saved_game("-3411-3232-44--3", db_file) is None
+
+
 def test__read():
     """ test the detection of valid sudoku string sequences with invalid initial value positions:
     check if sudoku has repeated values inside a row, column or a grid or
@@ -138,6 +166,46 @@ def test__read_3():
         assert isinstance(_read(sequence), str)
 
 
+def test__read_4():
+    """ test that games given as a string or dataframe are read without the txt file:
+    the file games are read from is moved to a folder that doesn't exist so reading it would fail,
+    a game given as a string and a copy given as a dataframe are still read and invalid values inside
+    a dataframe are still reported
+    """
+    read_from: str = Solution.read_input_from
+    Solution.read_input_from = os.path.join(tempfile.mkdtemp(), "missing", "input.txt")
+    try:
+        game = Solution(size="12233441|||")
+        game.read()
+        same_game = Solution(size=game.sudoku.copy())
+        same_game.read()
+        assert same_game.stringify()["start"] == game.stringify()["start"] == "12233441|||"
+        invalid_game = game.sudoku.copy()
+        invalid_game.iat[0, 1] = "1"
+        try:
+            Solution(size=invalid_game).read()
+        except InputError as error:
+            assert sorted(error.values, key=lambda value: value["col"]) == [{"row": 1, "col": 2, "invalid_value": 1},
+                                                                            {"row": 1, "col": 4, "invalid_value": 1}]
+        else:
+            assert False
+    finally:
+        Solution.read_input_from = read_from
+
+
+def test__read_5():
+    """ test that games entered in the main menu keep their uppercase symbols when they need them:
+    a 36 by 36 sudoku uses the letter A for the value 36 so the _entered function keeps it as it
+    was entered and it's read, while in lowercase it has equal values, commands are still lowercased
+    """
+    symbols: str = Solution.symbols(36)
+    game: str = "".join(symbols[(6 * (row % 6) + row // 6 + col) % 36] if (row + col) % 3 else "-"
+                        for row in range(36) for col in range(36))
+    assert _entered(game) == game and _entered("N") == "n" and _entered("12233441|||") == "12233441|||"
+    assert isinstance(_read(_entered(game)), tuple)
+    assert "equal values (10)" in _read(game.lower())
+
+
 def test__solve():
     """ test that a valid sudoku string with no solution is detected:
     raise error if sudoku has valid initial values but down the line the sudoku turns out to be
@@ -153,22 +221,25 @@ def test__solve_2():
     check that the program stop after an amount of time (minutes) if the sudoku is too difficult and takes
     too long to solve
     This is the string representation of a 16 by 16 sudoku with only 55 starting values few enough to make
-    this sudoku unsolvable for this program with the current method since it would end taking too much time
-    (no solution even after more than one hour running the program) and memory usage
+    this sudoku unsolvable for this program with the propagation engine and no human strategies since it would
+    end taking too much time (no solution even after more than one hour running the program) and memory usage
     49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|2544a7cbd1edf9|43a1d5f4|5a8f|1f3g98bage|
     6174d2f5|189cbg|697783f1
     if the _solve function can find a solution in the given time a tuple is returned with the game
     info otherwise a string is returned with the error message raised by the program
     """
-    assert isinstance(_solve(Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|"
-                                           "2544a7cbd1edf9|43a1d5f4|5a8f|1f3g98bage|6174d2f5|189cbg|"
-                                           "697783f1"), max_time=0.1), SudokuError)
+    too_difficult = Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|"
+                                  "2544a7cbd1edf9|43a1d5f4|5a8f|1f3g98bage|6174d2f5|189cbg|697783f1")
+    # without the human strategies the propagation engine is left with the plain branch search
+    too_difficult.strategies = ()
+    assert isinstance(_solve(too_difficult, max_time=0.1, engine="propagation"), SudokuError)
 
 
 def test__solve_3():
     """ test that different sizes sudokus are correctly solved (4, 9, 16 the only supported sizes):
     if a solution is found then the _solve function returns a tuple with info about the game and the solution,
-    in this case the solution returned is represented by a string
+    in this case the solution returned is represented by a string, every game is solved with both engines
+    and with the breadth and depth searches of the propagation engine
     """
     sudoku_and_solution = {
         "-3411-3232-44--3": "2341143232144123",
@@ -191,5 +262,279 @@ def test__solve_3():
                        "473e9b8da1c56gf7b215f4c96a8e3dg5f4a6e7g3cd128b9ge8d1a935b42c7f6693cb28dfg7e4a51"
     }
     for problem, solution in sudoku_and_solution.items():
-        program_solution: tuple[str, dict, dict] = _solve(Solution(size=problem), max_time=0.2)
-        assert program_solution[2]["end"] == solution
+        for engine, search in (("propagation", "breadth"), ("propagation", "depth"), ("dlx", "breadth")):
+            game = Solution(size=problem)
+            game.search = search
+            program_solution: tuple[str, dict, dict] = _solve(game, max_time=0.2, engine=engine)
+            assert program_solution[2]["end"] == solution
+
+
+def test__solve_4():
+    """ test that the human strategies (subsets, pointing, box line, fish and wings) solve the 16 by 16 sudoku
+    that was too difficult for the plain branch search (see test__solve_2) well under the time limit:
+    if a solution is found the _solve function returns a tuple and the solution string is checked
+    """
+    for engine in ("propagation", "dlx"):
+        program_solution = _solve(Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|"
+                                                "2544a7cbd1edf9|43a1d5f4|5a8f|1f3g98bage|6174d2f5|189cbg|"
+                                                "697783f1"), max_time=0.1, engine=engine)
+        assert program_solution[2]["end"] == ("dfc958g463ea71b21e72f6dcgb459a3864a57b31f928ecgd3gb89e2a1cd7456f"
+                                              "578b4fc63a12d9eg4d9c25ab7g6e83f1a1f63ge7589db42ce23g1d98b4cfa675"
+                                              "786fg31e4d59c2abg5e46c82a7fb1d93ca23d7b9e18g5f469b1da45f263cge87"
+                                              "f9g1b26d85a437ceb6dec14g9f73285a8347eaf5c2g16bd92c5a8973deb6fg14")
+
+
+def test__solve_5():
+    """ test that splitting the search frontier between worker processes finds the same solution as the serial
+    search: the solution string, the branch that solved the game and the iterations must be the same
+    """
+    results: list = []
+    for workers in (1, 2):
+        game = Solution(size="-------12--------3--23--4----1----5--4-6--7-8-----9-----6--8---9-7-2-----1----5--")
+        game.strategies = ()
+        game.workers = workers
+        game.solve()
+        results.append((game.stringify()["end"], game.solution_path, game.iterations))
+    assert results[0] == results[1]
+
+
+def test__solve_6():
+    """ test that the work limit and the cancel method stop the search: the work limit is counted in search
+    steps so the same sudoku always stops after the same amount of work, also when it's split between worker
+    processes, a cancelled game stops right away, in every case the _solve function returns a time SudokuError
+    """
+    stopped_at: list = []
+    for _ in range(2):
+        game = Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|2544a7cbd1edf9|43a1d5f4|"
+                             "5a8f|1f3g98bage|6174d2f5|189cbg|697783f1")
+        game.strategies = ()
+        game.max_work = 2_000
+        error = _solve(game, max_time=1, engine="propagation")
+        assert isinstance(error, SudokuError) and error.time
+        stopped_at.append(game.work)
+    assert stopped_at[0] == stopped_at[1]
+    # the worker processes share the work limit, each one checks it every 256 steps
+    game = Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|2544a7cbd1edf9|43a1d5f4|"
+                         "5a8f|1f3g98bage|6174d2f5|189cbg|697783f1")
+    game.strategies = ()
+    game.workers = 2
+    game.max_work = 4_000
+    error = _solve(game, max_time=1, engine="propagation")
+    assert isinstance(error, SudokuError) and error.time and game.work <= 4_000 + 256 * game.workers
+    game = Solution(size="-3411-3232-44--3")
+    game.cancel()
+    error = _solve(game, max_time=1)
+    assert isinstance(error, SudokuError) and error.time
+
+
+def test__solve_7():
+    """ test that sizes past 16 are solved too: a 25 by 25 sudoku, with the letters a to p as the values 10 to 25,
+    is solved by the dancing links engine that the _solve function picks for sudokus bigger than 9 by 9
+    """
+    program_solution = _solve(Solution(size=("2j6h718f98amboebf2idjel6mio7pl|4d7i9ec8d6ehfah3jok5l2m4ocpj|"
+                                           "28314i659oaab3f7jpkjmnne|1a4n627489bkcljml3m5|"
+                                           "2m3p73ajb4c5d9feh6l1nkog|1m4k5e618i9pc9d5hoj3p6|"
+                                           "1423678mbnc2dbelfoipljmgnfokp1|1n2l7g8ja4bpcieefkicjbkmoaph|"
+                                           "5i669kbac4f3gdiek8nn|1b4f5o639aa5b6gkkloe|1k6g7f92a3cofbnjop|"
+                                           "163a5f6b7p85dke7fni2k4mmno|13244m6l8ha7e9fihpikkb|4p5g9ne2f6j9lao5pi|"
+                                           "22395l6i78fpgnhei6mkndo4|5a687j8ld4e5f9jck3lpofpk|"
+                                           "1c3i485k79b7cpgfi4m2pe|26344b6p779mb2ccdnfggjioj1keml|"
+                                           "215p7oc6dfeaggh5jkk2mjpc|1e32556k8nacbdc3fhgbkplmm8oip4|"
+                                           "2g364a586m9bc7epgei3j5kkmhnc|17427d8gcmdee6gcihlfm9o1|"
+                                           "1i2p44518k9ca6caenfdhji9me|2b93gmhdk6man4o8|"
+                                           "2c3l4h5m647a889ickfjn5")), max_time=5)
+    assert program_solution[2]["end"] == ("5j394h1f8mongb2akdec6ip7lgfkd7nipel186ha93bo524mcj281ic5k6oa3dmf74lgpj9nehb"
+                                          "ahen6249gbklpjc17imf358odomplbc3d7j459ie268nh1fkgama7ke1lipdg958fhoj3n4cb26"
+                                          "43c6d7emh8n2blo5api9jgfk1nl812ogj94pi7ek6fcbm5d3ahp5jgi6bckfa4h13d2e78lon9m"
+                                          "b9hfo3n2a56jcdmk41glip7e8ken7hgf123loa4b8m5dic6jp96iacfbp5d9hek7n312j48molg"
+                                          "34dmjlch675g89iopkabe12nf8obpgem4nkj1d26lcf97a3h5i1295li8ajomf3cpne6hgbkd47"
+                                          "hdgoa8jl12eb459inmc3p76fkcni8ka9b5g7pjmlfh46do213ef64b9p73mi2cnkgj8o1ehlad5"
+                                          "l1m3pdoe4hi6fa8g57k2nj9bce72j5k6nfcd31ohb9alpm8gi49g6a8m2ob1f7lp4ei35kdhcjn"
+                                          "7ko23jdgln8me65cbh4af9i1pip541fhkc6ba2nd7j98ogelm3jbfen9573pchig1mdl26ka48o"
+                                          "dclhm4a8ie9ko3jpgnf17b562")
+
+
+def test__solve_8():
+    """ test that the stats of a solve are collected only when asked: without a SolveStats object extra_info
+    has no stats key, with one the counters describe the search and a parallel search counts the same
+    """
+    results: list = []
+    for workers in (1, 2):
+        game = Solution(size="-------12--------3--23--4----1----5--4-6--7-8-----9-----6--8---9-7-2-----1----5--")
+        game.strategies = ()
+        game.workers = workers
+        assert "stats" not in game.extra_info()
+        game.stats = SolveStats()
+        game.solve()
+        stats: dict = game.extra_info()["stats"]
+        assert stats["propagations"] > 0 and stats["eliminations"] > stats["propagations"]
+        assert stats["peak_frontier"] == max(stats["generations"]) and stats["snapshots"] == sum(stats["generations"])
+        # every node splits on the values of one cell so two nodes never reach the same game
+        assert stats["transpositions"] == 0
+        assert all(seconds >= 0 for seconds in stats["timers"].values())
+        results.append({key: value for key, value in stats.items() if key != "timers"})
+    assert results[0] == results[1]
+
+
+def test__solve_9():
+    """ test that a game is kept as a flat grid of values: the start and solved grids hold the values of
+    the stringify strings and the dataframes built from them when asked for show the same game with
+    letters for the values over 9 if that option is set
+    """
+    game = Solution(size="49a3g2|5f8c9geag8|2445a9|8abdgf|38gg|65|1a3fgc|6d79a4f7|5g8e|2544a7cbd1edf9|43a1d5f4|"
+                         "5a8f|1f3g98bage|6174d2f5|189cbg|697783f1", letter=True)
+    assert game.solved_grid is None and game.grid[0] == 0 and game.grid[3] == 9
+    game.solve()
+    strings: dict = game.stringify()
+    assert "".join(Solution.tr(value) for value in game.solved_grid) == strings["end"]
+    assert game.sudoku.at["row1", "col4"] == 9 and game.sudoku.at["row1", "col1"] == "-"
+    assert "".join(str(value) for value in game.puzzle.iloc[0]) == strings["end"][:16]
+    assert str(game) == str(game.puzzle)
+
+
+def test_solve_many():
+    """ test that solve_many solves a stream of sudoku strings: it yields a record for every game in the same
+    order, solved games carry the same solution the Solution class finds and invalid games carry their error
+    """
+    games: tuple = ("-3411-3232-44--3", "253244|5771||4862|1376|2945|113653|8899|17", "1234",
+                    "164372|378499||132246|8897|11|235467|2573|59")
+    records: list = list(solve_many(games, max_time=1))
+    assert [record["start"] for record in records] == list(games)
+    for record in records[:2]:
+        game = Solution(size=record["start"])
+        game.solve()
+        assert record["error"] is None and record["end"] == game.stringify()["end"]
+        assert record["start_vals"] == game.extra_info()["start_vals"]
+    assert all(isinstance(record["error"], InputError) and record["end"] is None for record in records[2:])
+
+
+def test__is_unique():
+    """ test that sudokus with only one solution are told apart from sudokus with many or none:
+    the _is_unique function returns True only for sudokus with exactly one solution and None for sudokus
+    that couldn't be checked before a limit was reached
+    """
+    assert _is_unique(Solution(size="-3411-3232-44--3"))
+    stopped = Solution(size="-3411-3232-44--3")
+    stopped.cancel()
+    assert _is_unique(stopped) is None
+    assert _is_unique(Solution(size="253244|5771||4862|1376|2945|113653|8899|17"))
+    assert _is_unique(Solution(size="12233441|||")) is False
+    assert _is_unique(Solution(size="164372|378499||132246|8897|11|235467|2573|59")) is False
+    game = Solution(size="-------12--------3--23--4----1----5--4-6--7-8-----9-----6--8---9-7-2-----1----5--")
+    assert game.count_solutions(limit=5) == 5
+
+
+def test_generate():
+    """ test that generated sudokus are valid games with only one solution: the generate function yields as many
+    games as asked, never with more initial values than the givens argument, and their solution is the one the
+    Solution class finds, sizes past 16 by 16 can't be generated and the command line saves the games into a
+    database that doesn't have the sudokus table yet
+    """
+    for size, givens in ((4, 0), (9, 30), (16, 140)):
+        records: list = list(generate(size, 3, givens=givens, seed=size))
+        assert len(records) == 3
+        for record in records:
+            assert record["error"] is None and (not givens or record["start_vals"] <= givens)
+            game = Solution(size=record["start"])
+            assert game.is_unique()
+            game.solve()
+            assert game.stringify()["end"] == record["end"]
+    try:
+        next(generate(25, 1))
+    except InputError:
+        pass
+    else:
+        assert False
+    # a new database gets the sudokus table the first time games are saved into it
+    db_file: str = os.path.join(tempfile.mkdtemp(), "fresh.db")
+    generator_main(["4", "3", "--seed", "4", "--db", db_file])
+    with Database(db_path=db_file) as saved_db:
+        saved: list = list(saved_db.read_db("SELECT start_str, end_str, init_vals, difficulty, size FROM sudokus"))
+    assert len(saved) == 3 and all(row[4] == 4 for row in saved)
+    assert _saved_game(saved[0][0], db_file) == (saved[0][1], saved[0][2], saved[0][3])
+
+
+def test_benchmark():
+    """ test the benchmark suite: every game of the corpus is solved without errors, the results have the
+    values of each size asked for and the import time, and comparing them with a baseline reports only the
+    values that got worse
+    """
+    corpus: dict = load_corpus(os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_corpus.json"))
+    assert set(corpus["puzzles"]) == {"4", "9", "16"}
+    results: dict = run_benchmark(corpus, sizes=[4], repeat=1)
+    assert list(results["sizes"]) == ["4"] and results["sizes"]["4"]["errors"] == 0
+    assert results["sizes"]["4"]["p50_ms"] <= results["sizes"]["4"]["p99_ms"]
+    # solving from a script must not load the modules that only show games
+    assert results["import_loads"] == [] and results["import_ms"] > 0
+    assert compare(results, results) == []
+    assert len(compare({**results, "import_ms": results["import_ms"] * 2 + 2}, results)) == 1
+    slower: dict = {**results, "sizes": {"4": {**results["sizes"]["4"], "errors": 1,
+                                               "solves_per_sec": results["sizes"]["4"]["solves_per_sec"] / 2}}}
+    assert len(compare(slower, results)) == 2 and compare(results, slower) == []
+    try:
+        compare(results, {**results, "version": 0})
+    except InputError:
+        pass
+    else:
+        assert False
+
+
+def test_solution_cache():
+    """ test that copies of a solved sudoku are answered by the solution cache: the game with its values
+    relabelled and transposed has the same canonical form, solving it takes no search and the solution is
+    the one the search finds, also after reading the cache back from its database, games with too many
+    symmetries to find their canonical form quickly are misses
+    """
+    game: str = "1----7-9--3--2---8--96--5----53--9---1--8---26----4---3------1--4------7--7---3--"
+    rows: list[str] = [game[row * 9:row * 9 + 9] for row in range(9)]
+    copy: str = "".join(str(10 - int(rows[col][row])) if rows[col][row] != "-" else "-"
+                        for row in range(9) for col in range(9))
+    assert canonical_form(game) == canonical_form(copy) != canonical_form(game.replace("1", "-", 1))
+    db_file: str = os.path.join(tempfile.mkdtemp(), "cache.db")
+    cache = SolutionCache(db_path=db_file)
+    records: list = list(solve_many([game, copy], cache=cache))
+    assert cache.hits == 1 and cache.misses == 1
+    assert records[1]["end"] == next(solve_many([copy]))["end"]
+    saved = SolutionCache(db_path=db_file)
+    solved = Solution(size=copy)
+    solved.cache = saved
+    solved.stats = SolveStats()
+    solved.solve()
+    assert saved.hits == 1 and solved.stringify()["end"] == records[1]["end"]
+    assert solved.extra_info()["stats"]["propagations"] == 0
+    # a solved game has too many symmetries for a canonical form, it's a miss that is never saved
+    assert canonical_form(records[0]["end"]) is None
+    assert next(solve_many([records[0]["end"]], cache=cache))["end"] == records[0]["end"]
+    assert cache.misses == 2 and len(cache) == 1
+
+
+def test_codec():
+    """ test that many sudoku strings are decoded at once: valid games in both formats get the values
+    the Sudoku class reads and encode back to the same strings, invalid formats, games with too few
+    initial values and games with equal values in a unit get an InputError with the repeated cells
+    """
+    games: list[str] = ["12233441|||", "-3411-3232-44--3", "1-2-------------", "12233441||", "1-23--3---------",
+                        "-------12--------3--23--4----1----5--4-6--7-8-----9-----6--8---9-7-2-----1----5--"]
+    grids, errors = decode_games(games, size=4)
+    assert grids.shape == (6, 4, 4) and grids[1].tolist() == [[0, 3, 4, 1], [1, 0, 3, 2], [3, 2, 0, 4], [4, 0, 0, 3]]
+    assert errors[0] is None and errors[1] is None
+    for game, string in zip(games[:2], encode_games(grids[:2])):
+        read_game = Solution(size=game)
+        read_game.read()
+        assert read_game.stringify()["start"] == string
+    assert all(isinstance(error, InputError) for error in errors[2:]) and not grids[2:].any()
+    assert errors[4].values == [{"row": 1, "col": 4, "invalid_value": 3}, {"row": 2, "col": 3, "invalid_value": 3}]
+
+
+def test_render():
+    """ test that boards are drawn from the flat values of a game: the header and the row labels keep the
+    width of every column, a colored cell keeps its place and changing a cell only changes that cell
+    """
+    board = Board(4, [2, 3, 4, 1] + ["-"] * 12, {0: RED})
+    lines: list[str] = str(board).split("\n")
+    assert lines[0] == "     col1 col2 col3 col4" and lines[2] == "row2    -    -    -    -"
+    assert lines[1] == f"row1    {RED}2\x1b[0m    3    4    1" and len(lines) == 5
+    board.set(4, 1, GREEN)
+    assert str(board).split("\n")[2] == f"row2    {GREEN}1\x1b[0m    -    -    -"
+    assert str(board).split("\n")[1:2] + str(board).split("\n")[3:] == lines[1:2] + lines[3:]
+    assert str(Board(16, range(1, 257))).split("\n")[10].startswith("row10 ")